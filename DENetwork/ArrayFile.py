@@ -0,0 +1,173 @@
+"""* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
+ *                                                                                                                     *
+ *  Array File Class                                                                                                   *
+ *  Network Generator                                                                                                  *
+ *                                                                                                                     *
+ *  Created by Francisco Pozo on 30/08/16.                                                                             *
+ *  Copyright © 2016 Francisco Pozo. All rights reserved.                                                              *
+ *                                                                                                                     *
+ *  Class for binary files with named arrays of numbers. The file starts with a header (magic text, byte order mark    *
+ *  and number of arrays) and then every array has its own header (length of the name, type code of the array module  *
+ *  and size in bytes), its name and its data. Everything is padded to 8 bytes, so the data of every array is aligned  *
+ *  and it can be used directly from the file. The numbers are saved in the byte order of the machine that writes it.  *
+ *  The file is opened with a memory map and every array is a memoryview of the map, so opening a file does not read   *
+ *  its arrays, the pages are only read when they are accessed.                                                        *
+ *                                                                                                                     *
+ * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * """
+
+import mmap
+import struct
+
+
+class ArrayFile:
+    """
+    Class that opens a binary file of named arrays and gives every array as a memoryview of the file
+    """
+
+    # Variable definitions #
+
+    __magic = b'DENARRAY'                       # Text at the start of every array file
+    __byte_order_mark = 0x01020304              # Number to detect files written with another byte order
+    __file_header = struct.Struct('=8sII')      # Magic text, byte order mark and number of arrays
+    __array_header = struct.Struct('=Icxxx Q')  # Length of the name, type code and size of the data in bytes
+    __file = None                               # File handle of the array file
+    __map = None                                # Memory map of the file
+    __view = None                               # Memoryview of the whole memory map
+    __arrays = {}                               # Dictionary with the name as key and the memoryview as value
+    __names = []                                # Names of the arrays in the same order as in the file
+
+    # Standard function definitions #
+
+    def __init__(self, name):
+        """
+        Initialization of the array file, it maps the file and reads the headers of the arrays
+        :param name: name of the file
+        """
+        self.__arrays = {}
+        self.__names = []
+        self.__file = open(name, 'rb')
+        try:
+            self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.__view = memoryview(self.__map)
+            if len(self.__view) < self.__file_header.size:
+                raise ValueError("The file is not an array file")
+            magic, byte_order_mark, number_arrays = self.__file_header.unpack_from(self.__view, 0)
+            if magic != self.__magic:
+                raise ValueError("The file is not an array file")
+            if byte_order_mark != self.__byte_order_mark:
+                raise ValueError("The file was written with a different byte order")
+
+            position = self.__file_header.size
+            for _ in range(number_arrays):  # Read the header of every array and make a view of its data
+                name_length, type_code, size = self.__array_header.unpack_from(self.__view, position)
+                position += self.__array_header.size
+                array_name = bytes(self.__view[position:position + name_length]).decode('utf-8')
+                position += self.__padded(name_length)
+                if position + size > len(self.__view):
+                    raise ValueError("The array " + array_name + " is incomplete")
+                self.__arrays[array_name] = self.__view[position:position + size].cast(type_code.decode('ascii'))
+                self.__names.append(array_name)
+                position += self.__padded(size)
+        except (ValueError, struct.error):
+            self.close()
+            raise
+
+    def __str__(self):
+        """
+        String call of the array file class
+        :return: a string with the information
+        """
+        return "Array file with arrays " + str(self.__names)
+
+    def __enter__(self):
+        """
+        Enters a with statement
+        :return: the array file
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Exits a with statement, closing the file
+        :return: None
+        """
+        self.close()
+
+    # Private function definitions #
+
+    @staticmethod
+    def __padded(size):
+        """
+        Gets the size padded to a multiple of 8 bytes
+        :param size: size in bytes
+        :return: padded size in bytes
+        """
+        return (size + 7) // 8 * 8
+
+    # Public function definitions #
+
+    @staticmethod
+    def write(name, arrays):
+        """
+        Writes an array file
+        :param name: name of the file
+        :param arrays: list of tuples with the name and the array (of the array module) of every array
+        :return: None
+        """
+        # Check if the types and values are correct
+        if type(name) != str:
+            raise TypeError("The name must be a string")
+        if not all(type(array_name) == str for array_name, _ in arrays):
+            raise TypeError("The names of the arrays must be strings")
+
+        with open(name, 'wb') as f:
+            f.write(ArrayFile.__file_header.pack(ArrayFile.__magic, ArrayFile.__byte_order_mark, len(arrays)))
+            for array_name, data in arrays:
+                encoded_name = array_name.encode('utf-8')
+                size = len(data) * data.itemsize
+                f.write(ArrayFile.__array_header.pack(len(encoded_name), data.typecode.encode('ascii'), size))
+                f.write(encoded_name + bytes(ArrayFile.__padded(len(encoded_name)) - len(encoded_name)))
+                data.tofile(f)
+                f.write(bytes(ArrayFile.__padded(size) - size))
+
+    def get_names(self):
+        """
+        Gets the names of the arrays
+        :return: new list with the names in the same order as in the file
+        """
+        return list(self.__names)
+
+    def get_array(self, name):
+        """
+        Gets an array of the file, it is read from the file when it is accessed
+        :param name: name of the array
+        :return: read only memoryview of the array
+        """
+        try:
+            return self.__arrays[name]
+        except KeyError:
+            raise ValueError("There is no array " + str(name) + " in the file")
+
+    def close(self):
+        """
+        Closes the file, the arrays cannot be used after it. If some slice of an array is still used, the memory map
+        cannot be closed yet and it is closed when the slice is deleted
+        :return: None
+        """
+        try:
+            for view in self.__arrays.values():
+                view.release()
+            self.__arrays = {}
+            if self.__view is not None:
+                self.__view.release()
+                self.__view = None
+            if self.__map is not None:
+                try:
+                    self.__map.close()
+                except BufferError:  # Slices still point to the map, it is closed when they are collected
+                    pass
+                self.__map = None
+        finally:
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
@@ -22,13 +22,13 @@ class Dependency:
 
     # Variable definitions #
 
-    __predecessor_frame = None                  # Predecessor frame id number
-    __predecessor_link = None                   # Predecessor link id number (must be end of the path)
-    __successor_frame = None                    # Successor frame id number
-    __successor_link = None                     # Successor link id number (must be end of the path)
-    __waiting_time = None                       # Time for the successor frame to wait after the predecessor frame
+    __slots__ = ('__predecessor_frame',         # Predecessor frame id number
+                 '__predecessor_link',          # Predecessor link id number (must be end of the path)
+                 '__successor_frame',           # Successor frame id number
+                 '__successor_link',            # Successor link id number (must be end of the path)
+                 '__waiting_time',              # Time for the successor frame to wait after the predecessor frame
     # 0 => no waiting time
-    __deadline_time = None                      # Time that the successor frame has to be received after the predecessor
+                 '__deadline_time')             # Time that the successor frame has to be received after the predecessor
     # 0 => no deadline time
 
     # Standard function definitions #
@@ -88,6 +88,29 @@ class Dependency:
         self.__waiting_time = waiting_time
         self.__deadline_time = deadline_time
 
+    @classmethod
+    def _from_trusted(cls, predecessor_frame, predecessor_link, successor_frame, successor_link, waiting_time,
+                      deadline_time):
+        """
+        Creates a dependency without checking the values, only for values that are already known to be correct (as
+        the ones created by the network from checked parameters)
+        :param predecessor_frame: predecessor frame id
+        :param predecessor_link: predecessor link id (must be end of the path)
+        :param successor_frame: successor frame id
+        :param successor_link: successor link id (must be end of the path)
+        :param waiting_time: waiting time for the successor in microseconds
+        :param deadline_time: deadline time for the successor in microseconds
+        :return: dependency object
+        """
+        dependency = cls.__new__(cls)
+        dependency.__predecessor_frame = predecessor_frame
+        dependency.__predecessor_link = predecessor_link
+        dependency.__successor_frame = successor_frame
+        dependency.__successor_link = successor_link
+        dependency.__waiting_time = waiting_time
+        dependency.__deadline_time = deadline_time
+        return dependency
+
     def __str__(self):
         """
         String call of the frame class
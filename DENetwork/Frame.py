@@ -20,11 +20,11 @@ class Frame:
 
     # Variable definitions #
 
-    __sender = None                         # End system sender id of the frame
-    __receivers = []                        # List of end systems receivers id of the frame
-    __size = None                           # Size of the frame in bytes (it must be between 72 and 1526 bytes)
-    __period = None                         # Period in microseconds of the frame
-    __deadline = None                       # Deadline in microseconds of the frame (if 0 => same as period)
+    __slots__ = ('__sender',                # End system sender id of the frame
+                 '__receivers',             # List of end systems receivers id of the frame
+                 '__size',                  # Size of the frame in bytes (it must be between 72 and 1526 bytes)
+                 '__period',                # Period in microseconds of the frame
+                 '__deadline')              # Deadline in microseconds of the frame (if 0 => same as period)
 
     # Standard function definitions #
 
@@ -0,0 +1,131 @@
+"""* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
+ *                                                                                                                     *
+ *  Frame Cache Class                                                                                                  *
+ *  Network Generator                                                                                                  *
+ *                                                                                                                     *
+ *  Created by Francisco Pozo on 30/08/16.                                                                             *
+ *  Copyright © 2016 Francisco Pozo. All rights reserved.                                                              *
+ *                                                                                                                     *
+ *  Class to cache the paths and splits of the frames already written as text. Frames with the same sender and the     *
+ *  same receivers (as all the broadcast or locally frames of a sender) have the same paths and splits, so they are    *
+ *  only calculated for the first one. Every entry has a size (as its number of text lines) and the cache has a max    *
+ *  total size, the least recently used entries are dropped until the new one fits.                                    *
+ *                                                                                                                     *
+ * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * """
+
+from collections import OrderedDict
+
+
+class FrameCache:
+    """
+    Class that keeps the text of the paths and splits of the frames with the sender and receivers as key
+    """
+
+    # Variable definitions #
+
+    __max_size = 0                              # Max total size of the entries in the cache
+    __size = 0                                  # Total size of the entries in the cache
+    __entries = None                            # Ordered dictionary with (sender, receivers) as key, (entry, size) value
+    __hits = 0                                  # Number of times an entry was found
+    __misses = 0                                # Number of times an entry was not found
+
+    # Standard function definitions #
+
+    def __init__(self, max_size=256):
+        """
+        Initialization of an empty cache
+        :param max_size: max total size of the entries in the cache (the number of entries if all have size 1)
+        """
+        # Check if the types and values are correct
+        if type(max_size) != int:
+            raise TypeError("The max size of the cache must be an integer")
+        if max_size < 0:
+            raise ValueError("The max size of the cache must be a positive integer")
+
+        self.__max_size = max_size
+        self.__size = 0
+        self.__entries = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+
+    def __str__(self):
+        """
+        String call of the frame cache class
+        :return: a string with the information
+        """
+        return "Frame cache with " + str(len(self.__entries)) + " entries of size " + str(self.__size) + ", " + \
+               str(self.__hits) + " hits and " + str(self.__misses) + " misses"
+
+    def __len__(self):
+        """
+        Gets the number of entries in the cache
+        :return: number of entries
+        """
+        return len(self.__entries)
+
+    # Public function definitions #
+
+    @staticmethod
+    def get_key(sender, receivers):
+        """
+        Gets the key of a frame. The order of the receivers is part of the key as the paths and splits are written in
+        that order
+        :param sender: end system sender id
+        :param receivers: list of end systems receivers id
+        :return: key of the frame
+        """
+        return sender, tuple(receivers)
+
+    def get(self, key):
+        """
+        Gets the entry of a key and counts the hit or miss
+        :param key: key of the frame
+        :return: the entry saved, None if it is not in the cache
+        """
+        value = self.__entries.get(key)
+        if value is None:
+            self.__misses += 1
+            return None
+        self.__hits += 1
+        self.__entries.move_to_end(key)  # Mark it as the most recently used
+        return value[0]
+
+    def add(self, key, entry, size=1):
+        """
+        Adds a new entry in the cache, dropping the least recently used until it fits. Entries larger than the max
+        size of the cache are not saved
+        :param key: key of the frame
+        :param entry: entry to be saved
+        :param size: size of the entry, as its number of text lines
+        :return: None
+        """
+        if key in self.__entries:  # Replace the old entry
+            self.__size -= self.__entries.pop(key)[1]
+        if size > self.__max_size:
+            return
+        while self.__size + size > self.__max_size:
+            _, (_, dropped_size) = self.__entries.popitem(last=False)
+            self.__size -= dropped_size
+        self.__entries[key] = (entry, size)
+        self.__size += size
+
+    def get_size(self):
+        """
+        Gets the total size of the entries in the cache
+        :return: total size
+        """
+        return self.__size
+
+    def get_hits(self):
+        """
+        Gets the number of hits of the cache
+        :return: number of hits
+        """
+        return self.__hits
+
+    def get_misses(self):
+        """
+        Gets the number of misses of the cache
+        :return: number of misses
+        """
+        return self.__misses
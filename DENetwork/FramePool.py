@@ -0,0 +1,134 @@
+"""* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
+ *                                                                                                                     *
+ *  Frame Pool Class                                                                                                   *
+ *  Network Generator                                                                                                  *
+ *                                                                                                                     *
+ *  Created by Francisco Pozo on 30/08/16.                                                                             *
+ *  Copyright © 2016 Francisco Pozo. All rights reserved.                                                              *
+ *                                                                                                                     *
+ *  Class with the frames that are still available to create dependencies, saved by their index in the frame list.    *
+ *  The frames are also saved in buckets with the same period and deadline, so a random frame with a given period or   *
+ *  deadline is found without searching all the frames. Every list saves the position of its frames, so a frame is     *
+ *  removed in O(1) moving the last frame of the list into its position.                                               *
+ *                                                                                                                     *
+ * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * """
+
+
+class FramePool:
+    """
+    Class that has the indexes of the available frames, grouped by period and deadline
+    """
+
+    # Variable definitions #
+
+    __available = []                            # List with the indexes of all available frames
+    __available_positions = []                  # Position of every frame in the available list (-1 if removed)
+    __frame_keys = []                           # Tuple (period, deadline) of every frame
+    __buckets = {}                              # Dictionary with (period, deadline) as key and a list of frames
+    __bucket_positions = []                     # Position of every frame in its bucket
+    __keys_by_period = {}                       # Dictionary with the period as key and a list of bucket keys
+    __keys_by_deadline = {}                     # Dictionary with the deadline as key and a list of bucket keys
+
+    # Standard function definitions #
+
+    def __init__(self, periods, deadlines):
+        """
+        Initialization of the pool with all the frames available
+        :param periods: column with the period of every frame, their positions in the column are the indexes saved
+        :param deadlines: column with the deadline of every frame
+        """
+        self.__available = list(range(len(periods)))
+        self.__available_positions = list(range(len(periods)))
+        self.__frame_keys = []
+        self.__buckets = {}
+        self.__bucket_positions = []
+        self.__keys_by_period = {}
+        self.__keys_by_deadline = {}
+
+        for index, key in enumerate(zip(periods, deadlines)):  # Save every frame in its bucket with (period, deadline)
+            bucket = self.__buckets.get(key)
+            if bucket is None:  # New bucket, index it by period and deadline
+                bucket = []
+                self.__buckets[key] = bucket
+                self.__keys_by_period.setdefault(key[0], []).append(key)
+                self.__keys_by_deadline.setdefault(key[1], []).append(key)
+            self.__frame_keys.append(key)
+            self.__bucket_positions.append(len(bucket))
+            bucket.append(index)
+
+    def __str__(self):
+        """
+        String call of the frame pool class
+        :return: a string with the information
+        """
+        return "Frame pool with " + str(len(self.__available)) + " available frames in " + \
+               str(len(self.__buckets)) + " buckets"
+
+    def __len__(self):
+        """
+        Gets the number of available frames
+        :return: number of available frames
+        """
+        return len(self.__available)
+
+    # Public function definitions #
+
+    def remove(self, index):
+        """
+        Removes a frame from the pool, moving the last frame of every list into its position
+        :param index: index of the frame
+        :return: None
+        """
+        position = self.__available_positions[index]
+        if position < 0:
+            raise ValueError("The frame " + str(index) + " is not available")
+        last = self.__available.pop()
+        if last != index:
+            self.__available[position] = last
+            self.__available_positions[last] = position
+        self.__available_positions[index] = -1
+
+        bucket = self.__buckets[self.__frame_keys[index]]
+        position = self.__bucket_positions[index]
+        last = bucket.pop()
+        if last != index:
+            bucket[position] = last
+            self.__bucket_positions[last] = position
+
+    def pick(self, generator):
+        """
+        Removes a random frame from the pool
+        :param generator: random generator
+        :return: index of the frame, None if there are no frames
+        """
+        if len(self.__available) == 0:
+            return None
+        index = self.__available[generator.randrange(len(self.__available))]
+        self.remove(index)
+        return index
+
+    def pick_matching(self, generator, period, deadline):
+        """
+        Removes a random frame from the pool that has the same period or the same deadline, all of them with the same
+        probability
+        :param generator: random generator
+        :param period: period in microseconds
+        :param deadline: deadline in microseconds
+        :return: index of the frame, None if no frame has the same period or deadline
+        """
+        keys = list(self.__keys_by_period.get(period, []))
+        for key in self.__keys_by_deadline.get(deadline, []):
+            if key[0] != period:  # The buckets with the same period are already in
+                keys.append(key)
+        total = sum(len(self.__buckets[key]) for key in keys)
+        if total == 0:
+            return None
+
+        position = generator.randrange(total)  # Position of the frame in all the matching buckets together
+        for key in keys:
+            bucket = self.__buckets[key]
+            if position < len(bucket):
+                index = bucket[position]
+                self.remove(index)
+                return index
+            position -= len(bucket)
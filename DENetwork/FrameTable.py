@@ -0,0 +1,346 @@
+"""* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
+ *                                                                                                                     *
+ *  Frame Table Class                                                                                                  *
+ *  Network Generator                                                                                                  *
+ *                                                                                                                     *
+ *  Created by Francisco Pozo on 30/08/16.                                                                             *
+ *  Copyright © 2016 Francisco Pozo. All rights reserved.                                                              *
+ *                                                                                                                     *
+ *  Class for all the frames of a network saved by columns. Senders, periods, deadlines and sizes are arrays of        *
+ *  integers with the index of the frame as position. The receivers of all the frames are saved one after the other in *
+ *  one array, and the offsets array has the position where the receivers of every frame start (and one more position  *
+ *  at the end), so the receivers of the frame i are receivers[offsets[i]:offsets[i + 1]].                             *
+ *  Functions to find and update many frames at once work directly on the columns. Every frame can also be used as a   *
+ *  frame object through a frame view.                                                                                 *
+ *                                                                                                                     *
+ * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * """
+
+from array import array
+from DENetwork.FrameView import *
+
+
+class FrameTable:
+    """
+    Class that has the information of all the time-triggered frames of a network in columns
+    """
+
+    # Variable definitions #
+
+    __senders = None                            # Array with the end system sender id of every frame
+    __periods = None                            # Array with the period in microseconds of every frame
+    __deadlines = None                          # Array with the deadline in microseconds of every frame
+    __sizes = None                              # Array with the size in bytes of every frame
+    __receiver_offsets = None                   # Array with the position of the first receiver of every frame
+    __receivers = None                          # Array with the end systems receivers id of all the frames
+
+    # Standard function definitions #
+
+    def __init__(self):
+        """
+        Initialization of an empty frame table
+        """
+        self.__senders = array('l')
+        self.__periods = array('l')
+        self.__deadlines = array('l')
+        self.__sizes = array('l')
+        self.__receiver_offsets = array('l', [0])
+        self.__receivers = array('l')
+
+    def __str__(self):
+        """
+        String call of the frame table class
+        :return: a string with the information
+        """
+        return "Frame table with " + str(len(self.__senders)) + " frames and " + str(len(self.__receivers)) + \
+               " receivers"
+
+    def __len__(self):
+        """
+        Gets the number of frames
+        :return: number of frames
+        """
+        return len(self.__senders)
+
+    def __getitem__(self, index):
+        """
+        Gets a frame of the table
+        :param index: index of the frame
+        :return: frame view of the frame
+        """
+        if index < 0:
+            index += len(self.__senders)
+        if index < 0 or index >= len(self.__senders):
+            raise IndexError("The frame " + str(index) + " does not exist")
+        return FrameView(self, index)
+
+    def __iter__(self):
+        """
+        Iterates over all the frames of the table
+        :return: iterator of frame views
+        """
+        for index in range(len(self.__senders)):
+            yield FrameView(self, index)
+
+    # Private function definitions #
+
+    @staticmethod
+    def __check_period(period):
+        """
+        Checks that the period is correct
+        :param period: period in microseconds
+        :return: None
+        """
+        if type(period) != int:
+            raise TypeError("The period must be an integer")
+        if period <= 0:
+            raise ValueError("The period must be a positive integer")
+
+    @staticmethod
+    def __check_deadline(deadline):
+        """
+        Checks that the deadline is correct
+        :param deadline: deadline in microseconds
+        :return: None
+        """
+        if type(deadline) != int:
+            raise TypeError("The deadline must be an integer")
+        if deadline <= 0:
+            raise ValueError("The deadline must be a positive integer")
+
+    @staticmethod
+    def __check_size(size):
+        """
+        Checks that the size is correct
+        :param size: size in bytes
+        :return: None
+        """
+        if type(size) != int:
+            raise TypeError("The frame size must be an integer")
+        if size < 72 or size > 1526:  # The size must be inside the Ethernet Standard
+            raise ValueError("The frame size must be between 72 and 1526 (Ethernet Standard)")
+
+    # Public function definitions #
+
+    def add_frame(self, sender, receivers, period=10000, deadline=0, size=1526):
+        """
+        Adds a new frame at the end of the table
+        :param sender: end system sender id
+        :param receivers: list of end systems receivers id
+        :param period: period in microseconds
+        :param deadline: deadline in microseconds, should be smaller than the period (if 0 => same as period)
+        :param size: size in bytes of the frame, must be in the Ethernet Standard range
+        :return: index of the new frame
+        """
+        # Check if the types and values are correct
+        if type(sender) != int:
+            raise TypeError("The sender must be an integer")
+        if sender <= 0:
+            raise ValueError("The sender id must be a positive integer")
+
+        if type(receivers) != list:
+            raise TypeError("The receivers must be a list of integers")
+        if not all(type(receiver) == int for receiver in receivers):  # Check if all items in the list are integers
+            raise TypeError("All items in the receivers list must be a integer")
+        if not all(receiver >= 0 for receiver in receivers):  # Check if all items in the list are positive
+            raise ValueError("All receivers id must be a positive integer")
+
+        self.__check_period(period)
+        if type(deadline) != int:
+            raise TypeError("The deadline must be an integer")
+        if deadline < 0 or deadline > period:
+            raise ValueError("The period must be a positive integer smaller than the period")
+        self.__check_size(size)
+
+        self.__senders.append(sender)
+        self.__receivers.extend(receivers)
+        self.__receiver_offsets.append(len(self.__receivers))
+        self.__periods.append(period)
+        self.__deadlines.append(period if deadline == 0 else deadline)  # If deadline is 0 => deadline = period
+        self.__sizes.append(size)
+        return len(self.__senders) - 1
+
+    def _add_trusted_frame(self, sender, receivers):
+        """
+        Adds a new frame at the end of the table without checking the values, with the default period, deadline and
+        size. Only for values that are already known to be correct (as the end systems chosen by the network)
+        :param sender: end system sender id
+        :param receivers: list of end systems receivers id
+        :return: index of the new frame
+        """
+        self.__senders.append(sender)
+        self.__receivers.extend(receivers)
+        self.__receiver_offsets.append(len(self.__receivers))
+        self.__periods.append(10000)
+        self.__deadlines.append(10000)
+        self.__sizes.append(1526)
+        return len(self.__senders) - 1
+
+    def get_sender(self, index):
+        """
+        Gets the sender of a frame
+        :param index: index of the frame
+        :return: frame sender
+        """
+        return self.__senders[index]
+
+    def get_receivers(self, index):
+        """
+        Gets the list of receivers of a frame
+        :param index: index of the frame
+        :return: new receivers list
+        """
+        return self.__receivers[self.__receiver_offsets[index]:self.__receiver_offsets[index + 1]].tolist()
+
+    def get_num_receivers(self, index):
+        """
+        Gets the number of receivers of a frame
+        :param index: index of the frame
+        :return: number of receivers
+        """
+        return self.__receiver_offsets[index + 1] - self.__receiver_offsets[index]
+
+    def get_period(self, index):
+        """
+        Gets the period of a frame
+        :param index: index of the frame
+        :return: frame period
+        """
+        return self.__periods[index]
+
+    def set_period(self, index, period):
+        """
+        Sets the period of a frame
+        :param index: index of the frame
+        :param period: period in microseconds
+        :return: None
+        """
+        self.__check_period(period)
+        self.__periods[index] = period
+
+    def get_deadline(self, index):
+        """
+        Gets the deadline of a frame
+        :param index: index of the frame
+        :return: frame deadline
+        """
+        return self.__deadlines[index]
+
+    def set_deadline(self, index, deadline):
+        """
+        Sets the deadline of a frame
+        :param index: index of the frame
+        :param deadline: deadline in microseconds
+        :return: None
+        """
+        self.__check_deadline(deadline)
+        self.__deadlines[index] = deadline
+
+    def get_size(self, index):
+        """
+        Gets the size of a frame
+        :param index: index of the frame
+        :return: frame size
+        """
+        return self.__sizes[index]
+
+    def set_size(self, index, size):
+        """
+        Sets the size of a frame
+        :param index: index of the frame
+        :param size: size in bytes
+        :return: None
+        """
+        self.__check_size(size)
+        self.__sizes[index] = size
+
+    def get_senders(self):
+        """
+        Gets the column of senders, it should not be modified
+        :return: array with the sender of every frame
+        """
+        return self.__senders
+
+    def get_periods(self):
+        """
+        Gets the column of periods, it should not be modified
+        :return: array with the period of every frame
+        """
+        return self.__periods
+
+    def get_deadlines(self):
+        """
+        Gets the column of deadlines, it should not be modified
+        :return: array with the deadline of every frame
+        """
+        return self.__deadlines
+
+    def get_sizes(self):
+        """
+        Gets the column of sizes, it should not be modified
+        :return: array with the size of every frame
+        """
+        return self.__sizes
+
+    def find_frames(self, period=None, deadline=None, sender=None):
+        """
+        Finds the frames that have all the given values
+        :param period: period in microseconds, None for any period
+        :param deadline: deadline in microseconds, None for any deadline
+        :param sender: end system sender id, None for any sender
+        :return: list with the indexes of the frames found, in order
+        """
+        indexes = range(len(self.__senders))
+        for value, column in ((period, self.__periods), (deadline, self.__deadlines), (sender, self.__senders)):
+            if value is not None:
+                indexes = [index for index in indexes if column[index] == value]
+        return list(indexes)
+
+    def set_params(self, indexes, period=None, deadline=None, size=None):
+        """
+        Sets the same values to many frames, the values are only checked once
+        :param indexes: list with the indexes of the frames
+        :param period: period in microseconds, None to not change it
+        :param deadline: deadline in microseconds, None to not change it
+        :param size: size in bytes, None to not change it
+        :return: None
+        """
+        # Check if the types and values are correct
+        if period is not None:
+            self.__check_period(period)
+        if deadline is not None:
+            self.__check_deadline(deadline)
+        if size is not None:
+            self.__check_size(size)
+
+        for value, column in ((period, self.__periods), (deadline, self.__deadlines), (size, self.__sizes)):
+            if value is not None:
+                for index in indexes:
+                    column[index] = value
+
+    def set_params_by_class(self, classes, periods, deadlines=None, sizes=None):
+        """
+        Sets the values of all the frames from the class of every frame, the values of every class are only checked
+        once and all are checked before changing any frame. Classes that no frame has are not checked
+        :param classes: list with the class of every frame
+        :param periods: list with the period in microseconds of every class
+        :param deadlines: list with the deadline in microseconds of every class, None to not change them
+        :param sizes: list with the size in bytes of every class, None to not change them
+        :return: None
+        """
+        # Check if the types and values are correct
+        if len(classes) != len(self.__senders):
+            raise ValueError("There must be one class for every frame")
+        if deadlines is not None and len(deadlines) != len(periods):
+            raise ValueError("The deadlines list must be of equal size as the periods list")
+        if sizes is not None and len(sizes) != len(periods):
+            raise ValueError("The sizes list must be of equal size as the periods list")
+        for frame_class in set(classes):  # Only the classes used by some frame
+            self.__check_period(periods[frame_class])
+            if deadlines is not None:
+                self.__check_deadline(deadlines[frame_class])
+            if sizes is not None:
+                self.__check_size(sizes[frame_class])
+
+        for values, column in ((periods, self.__periods), (deadlines, self.__deadlines), (sizes, self.__sizes)):
+            if values is not None:
+                column[:] = array('l', [values[frame_class] for frame_class in classes])
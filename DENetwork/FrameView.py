@@ -0,0 +1,122 @@
+"""* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
+ *                                                                                                                     *
+ *  Frame View Class                                                                                                   *
+ *  Network Generator                                                                                                  *
+ *                                                                                                                     *
+ *  Created by Francisco Pozo on 30/08/16.                                                                             *
+ *  Copyright © 2016 Francisco Pozo. All rights reserved.                                                              *
+ *                                                                                                                     *
+ *  Class for one frame of a frame table. It has the same functions as the frame class, but it does not save anything  *
+ *  more than the table and the index of the frame, so the values are always read and written in the table.            *
+ *                                                                                                                     *
+ * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * """
+
+
+class FrameView:
+    """
+    Class that gives access to a frame saved in a frame table as if it was a frame object
+    """
+
+    # Variable definitions #
+
+    __slots__ = ('__table',                     # Frame table where the frame is saved
+                 '__index')                     # Index of the frame in the table
+
+    # Standard function definitions #
+
+    def __init__(self, table, index):
+        """
+        Initialization of the view of a frame
+        :param table: frame table
+        :param index: index of the frame in the table
+        """
+        self.__table = table
+        self.__index = index
+
+    def __str__(self):
+        """
+        String call of the frame view class
+        :return: a string with the information
+        """
+        return_text = "Frame information =>\n"
+        return_text += "    Sender id     : " + str(self.get_sender()) + "\n"
+        return_text += "    Receivers ids : " + str(self.get_receivers()) + "\n"
+        return_text += "    Period        : " + str(self.get_period()) + " microseconds\n"
+        return_text += "    Deadline      : " + str(self.get_deadline()) + " microseconds\n"
+        return_text += "    Size          : " + str(self.get_size()) + " bytes"
+        return return_text
+
+    # Public function definitions #
+
+    def get_index(self):
+        """
+        Gets the index of the frame in the table
+        :return: frame index
+        """
+        return self.__index
+
+    def get_period(self):
+        """
+        Gets the period of the frame
+        :return: frame period
+        """
+        return self.__table.get_period(self.__index)
+
+    def set_period(self, period):
+        """
+        Sets the period of the frame
+        :param period: period in microseconds
+        :return: None
+        """
+        self.__table.set_period(self.__index, period)
+
+    def get_deadline(self):
+        """
+        Gets the deadline of the frame
+        :return: deadline period
+        """
+        return self.__table.get_deadline(self.__index)
+
+    def set_deadline(self, deadline):
+        """
+        Sets the deadline of the frame
+        :param deadline: deadline in microseconds
+        :return: None
+        """
+        self.__table.set_deadline(self.__index, deadline)
+
+    def get_size(self):
+        """
+        Gets the size of the frame
+        :return: size frame
+        """
+        return self.__table.get_size(self.__index)
+
+    def set_size(self, size):
+        """
+        Sets the size of the frame
+        :param size: size in bytes
+        :return: None
+        """
+        self.__table.set_size(self.__index, size)
+
+    def get_sender(self):
+        """
+        Gets the sender of the frame
+        :return: frame sender
+        """
+        return self.__table.get_sender(self.__index)
+
+    def get_receivers(self):
+        """
+        Gets the list of receivers
+        :return: receivers list
+        """
+        return self.__table.get_receivers(self.__index)
+
+    def get_num_receivers(self):
+        """
+        Gets the number of receivers from that frame
+        :return: number of receivers
+        """
+        return self.__table.get_num_receivers(self.__index)
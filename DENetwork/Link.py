@@ -29,8 +29,8 @@ class Link:
 
     # Variable definitions #
 
-    __speed = 0                                 # Speed in MB/s
-    __link_type = 0                             # Link type
+    __slots__ = ('__speed',                     # Speed in MB/s
+                 '__link_type')                 # Link type
 
     # Standard function definitions #
 
@@ -51,6 +51,20 @@ class Link:
         self.__speed = speed
         self.__link_type = link_type
 
+    @classmethod
+    def _from_trusted(cls, speed, link_type):
+        """
+        Creates a link without checking the values, only for values that are already known to be correct (as the ones
+        saved in a topology)
+        :param speed: Speed of the link in MB/s
+        :param link_type: Type of the network (wired or wireless)
+        :return: link object
+        """
+        link = cls.__new__(cls)
+        link.__speed = speed
+        link.__link_type = link_type
+        return link
+
     def __str__(self):
         """
         String call of the link class
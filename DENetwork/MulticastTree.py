@@ -0,0 +1,116 @@
+"""* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
+ *                                                                                                                     *
+ *  Multicast Tree Class                                                                                               *
+ *  Network Generator                                                                                                  *
+ *                                                                                                                     *
+ *  Created by Francisco Pozo on 30/08/16.                                                                             *
+ *  Copyright © 2016 Francisco Pozo. All rights reserved.                                                              *
+ *                                                                                                                     *
+ *  Class for the multicast tree of a frame, the union of the paths from its sender to all its receivers. Every link   *
+ *  of the tree is saved once with the link before it in the path and its position (level) in the path, so the splits  *
+ *  of the frame (the levels where the paths take different links) are read from it in one pass.                       *
+ *  The paths are walked from the receiver to the sender and the walk stops at the first link that is already in the   *
+ *  tree, as the rest of the path is shared with a previous receiver.                                                  *
+ *                                                                                                                     *
+ * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * """
+
+
+class MulticastTree:
+    """
+    Class that has the union of the paths of a frame from its sender to its receivers
+    """
+
+    # Variable definitions #
+
+    __sender = None                             # End system sender id of the frame
+    __receivers = []                            # List of end systems receivers id of the frame
+    __levels = []                               # List with the links of every level, in order of appearance
+    __parent_links = {}                         # Dictionary with every link as key and the link before it as value
+    # None if the link leaves the sender
+
+    # Standard function definitions #
+
+    def __init__(self, path_engine, sender, receivers):
+        """
+        Initialization of the multicast tree, it builds the union of the paths
+        :param path_engine: path engine of the network
+        :param sender: end system sender id
+        :param receivers: list of end systems receivers id
+        """
+        self.__sender = sender
+        self.__receivers = receivers
+        self.__levels = []
+        self.__parent_links = {}
+
+        # Links from the sender up to the root, the path to every receiver starts with some of them
+        up_links = []
+        node = sender
+        while path_engine.get_parent(node) is not None:
+            up_links.append(path_engine.get_up_link(node))
+            node = path_engine.get_parent(node)
+
+        for receiver in receivers:  # Add the links of every path that are not already in the tree
+            ancestor = path_engine.get_lowest_common_ancestor(sender, receiver)
+            up_length = path_engine.get_depth(sender) - path_engine.get_depth(ancestor)
+            level = up_length + path_engine.get_depth(receiver) - path_engine.get_depth(ancestor) - 1
+            node = receiver
+            link = path_engine.get_down_link(node) if level >= up_length else up_links[level]
+            while link not in self.__parent_links:
+                if level >= up_length:  # Way down, climb from the receiver
+                    node = path_engine.get_parent(node)
+                    parent_link = path_engine.get_down_link(node) if level > up_length else \
+                        (up_links[level - 1] if level > 0 else None)
+                else:  # Way up, go back to the sender
+                    parent_link = up_links[level - 1] if level > 0 else None
+                self.__add_link(link, parent_link, level)
+                if parent_link is None:
+                    break
+                link = parent_link
+                level -= 1
+
+    def __str__(self):
+        """
+        String call of the multicast tree class
+        :return: a string with the information
+        """
+        return "Multicast tree from " + str(self.__sender) + " to " + str(len(self.__receivers)) + \
+               " receivers with " + str(len(self.__parent_links)) + " links"
+
+    # Private function definitions #
+
+    def __add_link(self, link, parent_link, level):
+        """
+        Adds a new link into the tree
+        :param link: index of the link
+        :param parent_link: index of the link before it in the path, None if it leaves the sender
+        :param level: position of the link in the path
+        :return: None
+        """
+        while len(self.__levels) <= level:
+            self.__levels.append([])
+        self.__levels[level].append(link)
+        self.__parent_links[link] = parent_link
+
+    # Public function definitions #
+
+    def get_levels(self):
+        """
+        Gets the links of the tree grouped by their position in the paths
+        :return: list with a list of links for every level
+        """
+        return self.__levels
+
+    def get_parent_link(self, link):
+        """
+        Gets the link before the given one in the paths of the frame
+        :param link: index of the link
+        :return: index of the parent link, None if it leaves the sender
+        """
+        return self.__parent_links[link]
+
+    def get_splits(self):
+        """
+        Gets the splits of the frame, the levels where the paths take more than one link
+        :return: list with the links of every split, in order of appearance in the paths
+        """
+        return [level for level in self.__levels if len(level) > 1]
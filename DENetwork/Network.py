@@ -13,17 +13,22 @@
  *                                                                                                                     *
  * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * """
 
-from random import seed, random, choice, shuffle, randint
-import networkx as nx
-import copy
-from DENetwork.Node import *
-from DENetwork.Link import *
+from random import Random
+from array import array
+from DENetwork.Topology import *
 from DENetwork.Frame import *
+from DENetwork.FrameTable import *
 from DENetwork.Dependency import *
-import xml.etree.ElementTree as Xml
-from xml.dom import minidom
+from DENetwork.PathEngine import *
+from DENetwork.PathStore import *
+from DENetwork.MulticastTree import *
+from DENetwork.FrameCache import *
+from DENetwork.FramePool import *
+from DENetwork.Sampler import *
+from DENetwork.XmlWriter import *
+from DENetwork.ArrayFile import *
+from DENetwork.SweepConfig import *
 import os
-import shutil
 
 
 class Network:
@@ -33,65 +38,89 @@ class Network:
 
     # Variable definitions #
 
-    __graph = None  # Network Graph built with the NetworkX package
+    __topology = None  # Nodes and links of the network saved in arrays
     __switches = []  # List with all the switches in the network
     __end_systems = []  # List with all the end systems in the network
-    __links = []  # List with all the links in the network
-    __links_container = []  # Contains the objects links (separated to increase generate path performance)
-    __paths = []  # Matrix with the number of end systems as index for x and y, it contains
-    # a list of links to describe the path from end system x to end system y, None if x = y
-    __frames = []  # List with all the frames in the network
+    __path_engine = None  # Tree structure of the network (parents and depths) to find the paths
+    __paths = None  # Path store indexed by end systems as [x][y], it contains
+    # a path handle to expand the links from end system x to end system y, empty if x = y
+    __frames = None  # Table with all the frames in the network
     __collision_domains = []  # Matrix with list of links that share the same frequency
     __num_dependencies = 0  # Number of dependencies
     __dependencies = []  # List of dependencies
-    __aux_frames = []  # Auxiliar array of frames to create dependencies
+    __frame_pool = None  # Pool with the indexes of the frames still available to create dependencies
+    __frame_cache = None  # Cache with the paths and splits text of the frames written in the xml
+    __nearest_receivers = {}  # Dictionary with the switches as key and the closest end systems to its end systems
+    __end_system_positions = {}  # Dictionary with the end systems as key and its position in the end systems list
+    __seed = None  # Seed of the random generator of the network (None => current time)
+    __random = None  # Random generator of the network, so networks do not share the random state
+    __topology_cache = {}  # Last topology created in this process for the sweep, with its description as key
 
     # Auxiliary variable definitions #
 
     # Standard function definitions #
 
-    def __init__(self):
+    def __init__(self, seed=None):
         """
         Initialization of an empty network
+        :param seed: seed of the random generator (int, float, str or bytes), None to seed with the current time
         """
-        self.__graph = None
+        self.__topology = Topology()
         self.__switches = []
         self.__end_systems = []
-        self.__links = []
-        self.__links_container = []
-        self.__paths = []
-        self.__frames = []
+        self.__path_engine = PathEngine()
+        self.__paths = None
+        self.__frames = FrameTable()
         self.__collision_domains = []
-        self.__graph = nx.Graph()  # Initialization of the graph with Networkx
-        seed()  # Seed with current time (many function use random)
+        self.__num_dependencies = 0
+        self.__dependencies = []
+        self.__frame_pool = None
+        self.__frame_cache = FrameCache()
+        self.__nearest_receivers = {}  # Both are filled when needed, and shared with the forks of the network
+        self.__end_system_positions = {}
+        self.__seed = seed
+        self.__random = Random(seed)  # Every network has its own generator (many function use random)
 
     # Private function definitions #
 
-    def __add_switch(self):
+    def __add_node(self, node_type, parent_node, link):
         """
-        Add a new switch into the network
-        :return: None
+        Add a new node into the network linked to its parent node
+        :param node_type: type of the node (switch or end system)
+        :param parent_node: number of the parent node, None for the root
+        :param link: tuple with the type and speed of the links, None for standard links (wired and 100 MBs)
+        :return: number of the new node
         """
-        # Add into the Networkx graph a new node with type => object.switch node, id => switch number
-        self.__graph.add_node(self.__graph.number_of_nodes(), type=Node(NodeType.switch), id=len(self.__switches))
-        self.__switches.append(self.__graph.number_of_nodes() - 1)  # Save the identifier of Networkx
+        if link is None:
+            node = self.__topology.add_node(node_type, parent_node)
+        else:
+            node = self.__topology.add_node(node_type, parent_node, link[1], link[0])
+        # Save its parent and the links to go up and down to find the paths
+        if parent_node is None:
+            self.__path_engine.add_root(node)
+        else:
+            self.__path_engine.add_node(node, parent_node, self.__topology.get_link_index(node, parent_node),
+                                        self.__topology.get_link_index(parent_node, node))
+        return node
 
-    def __add_link(self, source, destination, link_type=LinkType.wired, speed=100):
+    def __next_link(self, links):
         """
-        Adds a bi-directional link (two logical links) between a source node and a destination node
-        :param source: node source
-        :param destination: node destination
-        :param link_type: type of link (wired/wireless)
-        :param speed: link speed
+        Gets the description of the next link to add
+        :param links: list with the type and speed of every link already parsed, None if all are standard
+        :return: tuple with the type and speed of the link, None if all are standard
+        """
+        if links is None:
+            return None
+        return links[self.__topology.get_number_links() // 2 - 1]  # The first link takes the last description
+
+    def __add_switch(self, parent_node=None, link=None):
+        """
+        Add a new switch into the network
+        :param parent_node: number of the parent node, None for the root
+        :param link: tuple with the type and speed of the links to the parent, None for standard links
         :return: None
         """
-        # Add into the Networkx graph a new link between two node with type => object.link, id => link number
-        self.__graph.add_edge(source, destination, type=Link(speed=speed, link_type=link_type),
-                              id=self.__graph.number_of_edges() - 1)
-        self.__links.append([source, destination])  # Saves the same info in our link list with nodes
-        self.__links.append([destination, source])
-        self.__links_container.append(Link(speed=speed, link_type=link_type))  # Saves the object with same index
-        self.__links_container.append(Link(speed=speed, link_type=link_type))
+        self.__switches.append(self.__add_node(NodeType.switch, parent_node, link))
 
     def __change_switch_to_end_system(self, switch):
         """
@@ -99,65 +128,181 @@ class Network:
         :param switch: id of the switch
         :return: None
         """
-        self.__graph.node[switch]['type'] = Node(NodeType.end_system)  # Update the information into the graph
-        self.__graph.node[switch]['id'] = len(self.__end_systems)
+        self.__topology.set_node_type(switch, NodeType.end_system)
         self.__end_systems.append(switch)  # Update the information into our lists
-        self.__switches.remove(switch)
+        if self.__switches[-1] == switch:  # The create network function always changes the last switch added
+            self.__switches.pop()
+        else:
+            self.__switches.remove(switch)
 
-    def __add_end_system(self):
+    def __add_end_system(self, parent_node, link=None):
         """
         Add a new end system into the network
+        :param parent_node: number of the parent node
+        :param link: tuple with the type and speed of the links to the parent, None for standard links
         :return: None
         """
-        # Add into the Networkx graph a new node with type => object.end_system node, id => end system number
-        self.__graph.add_node(self.__graph.number_of_nodes(), type=Node(NodeType.end_system), id=len(self.__switches))
-        self.__end_systems.append(self.__graph.number_of_nodes() - 1)  # Save the identifier of Networkx
+        self.__end_systems.append(self.__add_node(NodeType.end_system, parent_node, link))
 
-    def __recursive_create_network(self, description, links, parent_node, num_calls):
+    def __iterative_create_network(self, description, links):
         """
-        Auxiliary recursive function for create network
+        Auxiliary function for create network, it reads the description once in depth order
+        The stack has the switches that still have branches to describe, with the number of branches remaining
         :param description: description of the network already parsed into integers
-        :param links: list with description of the links parameters in tuples
-        :param parent_node: number of the parent node of the actual call
-        :param num_calls: number of calls that has been done to the function (to iterate the description string)
-        :return: the updated number of calls
+        :param links: list with the type and speed of every link already parsed, None if all are standard
+        :return: the position of the last element of the description read
         """
+        stack = []
+        node = 0  # Node described by the actual element of the description
+        position = 0
         try:
-            if description[num_calls] < 0:  # Create new leafs as end systems and link them to the parent node
-                for i in range(abs(description[num_calls])):  # For all the new leafs add the end system and links
-                    self.__add_end_system()
-                    if links is None:
-                        self.__add_link(parent_node, self.__graph.number_of_nodes() - 1)
-                    else:  # If there exist description in links, add them
-                        link_type = LinkType.wired if links[self.__graph.number_of_edges() - 1][0] == 'w' \
-                            else LinkType.wireless
-                        speed = int(links[self.__graph.number_of_edges() - 1][1:])
-                        self.__add_link(parent_node, self.__graph.number_of_nodes() - 1, link_type, speed)
-
-            elif description[num_calls] == 0:  # Finished branch, change switch parent into end system
-                self.__change_switch_to_end_system(parent_node)
-
-            elif description[num_calls] > 0:  # Create new branches with switches
-                for i in range(description[num_calls]):  # For all new brances, create the switch and link it
-                    self.__add_switch()
-                    new_parent = self.__graph.number_of_nodes() - 1  # Save new parent node
-                    if links is None:
-                        self.__add_link(parent_node, self.__graph.number_of_nodes() - 1)
-                    else:  # If there exist description in links, add them
-                        link_type = LinkType.wired if links[self.__graph.number_of_edges() - 1][0] == 'w' \
-                            else LinkType.wireless
-                        speed = int(links[self.__graph.number_of_edges() - 1][1:])
-                        self.__add_link(parent_node, self.__graph.number_of_nodes() - 1, link_type, speed)
-                    # Call the recursive for the new branch
-                    num_calls = self.__recursive_create_network(description, links, new_parent, num_calls + 1)
-            else:
-                raise ValueError("The network description is wrongly formulated, not an integer")
+            while True:
+                if description[position] > 0:  # Create the first branch with a switch and describe it
+                    stack.append([node, description[position] - 1])
+                    self.__add_switch(node, self.__next_link(links))
+                    node = self.__switches[-1]
+                    position += 1
+                    continue
+
+                if description[position] < 0:  # Create new leafs as end systems and link them to the node
+                    for i in range(abs(description[position])):  # For all the new leafs add the end system and links
+                        self.__add_end_system(node, self.__next_link(links))
+                else:  # Finished branch, change switch into end system
+                    self.__change_switch_to_end_system(node)
+
+                # Backtrack to the last switch with branches remaining
+                while len(stack) > 0 and stack[-1][1] == 0:
+                    stack.pop()
+                if len(stack) == 0:  # All the branches are described
+                    return position
+                stack[-1][1] -= 1
+                self.__add_switch(stack[-1][0], self.__next_link(links))
+                node = self.__switches[-1]
+                position += 1
         except IndexError:
             raise ValueError("The network description is wrongly formulated, there are open branches")
-        return num_calls
+
+    def __build_nearest_receivers(self, switch):
+        """
+        Builds the closest end systems to the end systems of a switch, all of them share the same ones
+        The tree is visited by levels from the switch (up to the parent and down to the children) until a level with end
+        systems is found, the end systems of the switch. If the switch only has one, the visit continues until the next
+        level with end systems, the closest ones to that end system
+        :param switch: switch id
+        :return: tuple with the end systems of the switch and the next closest end systems (empty if the switch has more
+        than one end system), both in the same order as the end systems list
+        """
+        positions = self.__end_system_positions
+        visited = {switch}
+        level = [switch]
+        levels = []
+        while len(level) > 0 and (len(levels) == 0 or (len(levels) == 1 and len(levels[0]) == 1)):
+            next_level = []
+            for node in level:
+                neighbours = self.__topology.get_children(node)
+                if self.__topology.get_parent(node) is not None:
+                    neighbours.append(self.__topology.get_parent(node))
+                for neighbour in neighbours:
+                    if neighbour not in visited:
+                        visited.add(neighbour)
+                        next_level.append(neighbour)
+            end_systems = [node for node in next_level if node in positions]
+            if len(end_systems) > 0:
+                end_systems.sort(key=positions.get)  # Same order as the end systems list
+                levels.append(end_systems)
+            level = next_level
+        while len(levels) < 2:
+            levels.append([])
+        return levels[0], levels[1]
 
     # Public function definitions #
 
+    def get_seed(self):
+        """
+        Gets the seed of the random generator of the network
+        :return: seed, None if it was seeded with the current time
+        """
+        return self.__seed
+
+    def get_link_index(self, source, destination):
+        """
+        Gets the index of the link that goes from the source node to the destination node
+        :param source: node source
+        :param destination: node destination
+        :return: index of the link in the link list
+        """
+        return self.__topology.get_link_index(source, destination)
+
+    def get_link(self, source, destination):
+        """
+        Gets the link object that goes from the source node to the destination node
+        :param source: node source
+        :param destination: node destination
+        :return: link object
+        """
+        return self.__topology.get_link(self.get_link_index(source, destination))
+
+    def get_topology(self):
+        """
+        Gets the nodes and links of the network
+        :return: topology object
+        """
+        return self.__topology
+
+    def to_networkx(self):
+        """
+        Creates a NetworkX graph of the network with the node and link objects, only when it is needed as the network
+        does not use it
+        :return: NetworkX graph
+        """
+        return self.__topology.to_networkx()
+
+    def get_nearest_receivers(self, sender):
+        """
+        Gets the end systems with the shortest path from an end system (the receivers of its locally frames)
+        The end systems of the same switch share their closest end systems, they are found the first time one of them
+        is needed
+        :param sender: end system id
+        :return: new list with the closest end systems, in the same order as the end systems list
+        """
+        if len(self.__end_system_positions) == 0:
+            self.__end_system_positions.update((end_system, position) for position, end_system in
+                                               enumerate(self.__end_systems))
+        if sender not in self.__end_system_positions:
+            raise ValueError("The node " + str(sender) + " is not an end system")
+
+        switch = self.__topology.get_parent(sender)
+        if switch is None:  # The end system is the only node of the network
+            return []
+        nearest_receivers = self.__nearest_receivers.get(switch)
+        if nearest_receivers is None:
+            nearest_receivers = self.__build_nearest_receivers(switch)
+            self.__nearest_receivers[switch] = nearest_receivers
+        if len(nearest_receivers[0]) > 1:  # The other end systems of the switch
+            return [end_system for end_system in nearest_receivers[0] if end_system != sender]
+        return list(nearest_receivers[1])
+
+    def get_paths(self):
+        """
+        Gets the paths between the end systems, to be used as paths[sender][receiver]
+        :return: path store, None if the paths are not generated
+        """
+        return self.__paths
+
+    def get_frames(self):
+        """
+        Gets the frames of the network, every frame of the table can be used as a frame object
+        :return: frame table
+        """
+        return self.__frames
+
+    def get_frame_cache(self):
+        """
+        Gets the cache of paths and splits used in the last xml output, to see its hits and misses
+        :return: frame cache object
+        """
+        return self.__frame_cache
+
     def create_network(self, network_description, link_description=None):
         """
         Creates a network with the description received
@@ -173,7 +318,7 @@ class Network:
         x10 => wireless with 10 MBs
         :return: None
         """
-        self.__init__()
+        self.__init__(self.__seed)  # Same seed, so the same description always creates the same network
         description_separated = network_description.split(';')  # Split the string with ;
         if link_description is not None:  # If a link description is done split the string
             links = link_description.split(';')
@@ -191,12 +336,14 @@ class Network:
                 raise TypeError("The link description is wrongly formulated, some elements are not valid types")
 
         description = [int(numeric_string) for numeric_string in description_separated]  # Parse the string into ints
-        # Start the recursive call with parent switch 0
+        if links is not None:  # Parse the links into types and speeds
+            links = [(LinkType.wired if link[0] == 'w' else LinkType.wireless, int(link[1:])) for link in links]
+        # Start the description with parent switch 0
         self.__add_switch()
-        num_calls = self.__recursive_create_network(description, links, 0, 0)
+        position = self.__iterative_create_network(description, links)
 
         # Check if there are additional elements that should not be
-        if num_calls != len(description) - 1:
+        if position != len(description) - 1:
             raise ValueError("The network description is wrongly formulated, there are extra elements")
 
     def define_collision_domains(self, collision_domains):
@@ -209,7 +356,7 @@ class Network:
         for i in range(len(collision_domains)):
             for j in range(len(collision_domains[i])):
                 collision_domains[i][j] += 2
-                collision_domains[i][j] %= len(self.__links)
+                collision_domains[i][j] %= self.__topology.get_number_links()
 
         # Check if the types and values are correct
         if type(collision_domains) != list:
@@ -218,78 +365,44 @@ class Network:
             raise TypeError("The collision domains should be a matrix of integers")
         if not all(type(link) == int for collision_domain in collision_domains for link in collision_domain):
             raise TypeError("The collision domains should be a matrix of integers")
-        if not all(self.__links_container[link].get_type() == LinkType.wireless for collision_domain in
+        if not all(self.__topology.get_link_type(link) == LinkType.wireless for collision_domain in
                    collision_domains for link in collision_domain):
             raise ValueError("Some of the selected links are not wireless")
 
         # Copy the matrix to the local object
-        self.__collision_domains = map(list, collision_domains)
+        self.__collision_domains = [list(collision_domain) for collision_domain in collision_domains]
 
-    def generate_paths(self):
+    def fork(self, seed=None):
+        """
+        Creates a new network that shares the topology, paths, nearest receivers and collision domains of this one, but
+        without frames or dependencies. The shared parts are not modified by the network functions (the nearest
+        receivers are only filled when any of the networks needs them), so it is only a few references
+        :param seed: seed of the random generator of the new network, None to seed with the current time
+        :return: new network object
+        """
+        network = Network(seed)
+        network.__topology = self.__topology
+        network.__switches = self.__switches
+        network.__end_systems = self.__end_systems
+        network.__path_engine = self.__path_engine
+        network.__paths = self.__paths
+        network.__nearest_receivers = self.__nearest_receivers
+        network.__end_system_positions = self.__end_system_positions
+        network.__collision_domains = self.__collision_domains
+        return network
+
+    def generate_paths(self, cache_size=None, eager=False):
         """
         Generate all the shortest paths from every end systems to every other end system
-        Fills the 3 dimensions path matrix, first dimension is the sender, second dimension is the receiver,
-        third dimension is a list of INDEXES for the dataflow link list (not links ids, pointers to the link lists)
+        As the network has no cycles, the only path between two end systems goes through their lowest common ancestor
+        Creates the path store, first dimension is the sender, second dimension is the receiver, and the path is a
+        handle that expands to a list of INDEXES for the dataflow link list (not links ids, pointers to the link lists)
+        Paths are built every time they are accessed (as cheap as finding the common ancestor) unless they are kept
+        :param cache_size: max number of paths kept in memory, None to not keep them unless eager is selected
+        :param eager: True to build and keep all the paths now
         :return: None
         """
-        for i in range(self.__graph.number_of_nodes()):  # Init the path 3-dimension matrix with empty arrays
-            self.__paths.append([])
-            for j in range(self.__graph.number_of_nodes()):
-                self.__paths[i].append([])
-
-        for sender in self.__end_systems:  # We iterate over all the senders and receivers
-            for receiver in self.__end_systems:
-                if sender != receiver:  # If they are not the same search the path
-                    # As the paths save the indexes, of the links, we need to search them with tuples of nodes, we then
-                    # iterate throught all nodes find by the shortest path function of Networkx, and skip the first
-                    # iteration as we do not have a tuple of nodes yet
-                    first_iteration = False
-                    previos_node = None
-                    for h in nx.shortest_path(self.__graph, sender, receiver):  # For all nodes in the path
-                        if not first_iteration:
-                            first_iteration = True
-                        else:  # Find the index in the link list with the actual and previous node
-                            self.__paths[sender][receiver].append(self.__links.index([previos_node, h]))
-                        previos_node = h
-
-    @staticmethod
-    def __calculate_splits(paths):
-        """
-        Calculate the splits matrix of a given path matrix.
-        For every column on the matrix path, search if there are different links and add then in a new split row.
-        :param paths: 3-dimensional path matrix
-        :return: 3-dimesnsional split matrix
-        """
-        splits = []  # Matrix to save all the splits
-        path_index = 0  # Horizontal index of the path matrix
-        split_index = 0  # Vertical index of the split matrix
-        first_path_flag = False  # Flag to identify a first found path
-        found_split_flag = False  # Flag to identify a split has been found
-        paths_left = len(paths)  # Paths left to be checked
-        while paths_left > 1:  # While we did not finish all different splits
-            paths_left = 0  # Initialize the paths left
-            for i in range(len(paths)):  # For all the different paths
-                try:  # The try is needed because a path ended will raise an exception
-                    if not first_path_flag:  # Check if it is the first path found
-                        first_split = paths[i][path_index]  # Save to compare with other paths to check new splits
-                        first_path_flag = True
-                    else:
-                        if paths[i][path_index] != first_split:  # If it is difference, a new split has been found
-                            if not found_split_flag:  # If is the first split, save both links
-                                splits.append([])
-                                splits[split_index].append(first_split)
-                                found_split_flag = True
-                            if paths[i][path_index] not in splits[split_index]:  # If the split is not in the list
-                                splits[split_index].append(paths[i][path_index])  # Save the link split
-                    paths_left += 1  # The path has not ended if no exception had been raised
-                except IndexError:  # If there is an exception, the path ended and we continue
-                    pass
-            if found_split_flag:  # If a split has been found
-                split_index += 1  # Increase the split index
-                found_split_flag = False
-            first_path_flag = False  # Update the path flags and the path index for next iteration
-            path_index += 1
-        return splits  # Return the filled splits matrix
+        self.__paths = PathStore(self.__path_engine, self.__end_systems, cache_size, eager)
 
     def generate_frames(self, number_frames, per_broadcast=1.0, per_single=0.0, per_locally=0.0, per_multi=0.0):
         """
@@ -332,41 +445,39 @@ class Network:
         if per_broadcast + per_locally + per_multi + per_single == 0:
             raise ValueError("At least one percentage should be greater than 0")
 
-        # Normallize the percentage so the sum is always 1.0
-        sum_per = float(per_broadcast + per_single + per_locally + per_multi)
-        per_broadcast /= sum_per
-        per_multi /= sum_per
-        per_locally /= sum_per
-        per_single /= sum_per
-
-        for frame in range(number_frames):  # Iterate for all the frames that needs to be created
-            frame_type = random()  # Generate random to see which type of frame is
-            sender = choice(self.__end_systems)  # Select the sender end system
-            # Select  receivers dependending of the frame type
-            if frame_type < per_broadcast:  # Broadcast frame
-                receivers = list(self.__end_systems)  # List of all end systems but the sender
-                receivers.remove(sender)
-            elif frame_type < per_broadcast + per_single:  # Single frame
-                receivers = list(self.__end_systems)  # Select single receiver that is not the sender
-                receivers.remove(sender)
-                receivers = [choice(receivers)]
-            elif frame_type < per_broadcast + per_single + per_multi:  # Multi frame
-                receivers = list(self.__end_systems)  # Select a random number of receivers
-                receivers.remove(sender)
-                shuffle(receivers)
-                num_receivers = randint(1, len(receivers))
-                receivers = receivers[0:num_receivers]
+        # Draw the type (0 broadcast, 1 single, 2 multi, 3 locally) and the sender (its position in the end systems
+        # list) of all the frames at once, the sampler normalizes the percentages
+        num_end_systems = len(self.__end_systems)
+        frame_types = Sampler([per_broadcast, per_single, per_multi, per_locally]).choose_many(self.__random,
+                                                                                              number_frames)
+        senders = [self.__random.randrange(num_end_systems) for _ in range(number_frames)]
+        broadcast_receivers = {}  # Receivers of the broadcast frames of every sender, as they are always the same
+        # The end systems are integers from the topology and the receivers are chosen from them, so the frames are
+        # checked once for all of them: they are correct if no end system is the node 0 (it cannot be a sender)
+        if all(end_system > 0 for end_system in self.__end_systems):
+            add_frame = self.__frames._add_trusted_frame
+        else:
+            add_frame = self.__frames.add_frame
+
+        for frame_type, sender in zip(frame_types, senders):  # Iterate for all the frames that needs to be created
+            # Select receivers dependending of the frame type, the positions after the sender are moved one position
+            # to the right so the sender is never chosen without copying the end systems list
+            if frame_type == 0:  # Broadcast frame
+                receivers = broadcast_receivers.get(sender)
+                if receivers is None:  # List of all end systems but the sender
+                    receivers = self.__end_systems[:sender] + self.__end_systems[sender + 1:]
+                    broadcast_receivers[sender] = receivers
+            elif frame_type == 1:  # Single frame
+                receiver = self.__random.randrange(num_end_systems - 1)  # Select single receiver that is not the sender
+                receivers = [self.__end_systems[receiver + 1 if receiver >= sender else receiver]]
+            elif frame_type == 2:  # Multi frame
+                num_receivers = self.__random.randint(1, num_end_systems - 1)  # Select a random number of receivers
+                receivers = [self.__end_systems[receiver + 1 if receiver >= sender else receiver] for receiver in
+                             self.__random.sample(range(num_end_systems - 1), num_receivers)]
             else:  # Locally frame
-                possible_receivers = list(self.__end_systems)
-                possible_receivers.remove(sender)
-                distances = [len(self.__paths[sender][receiver]) for receiver in possible_receivers]
-                min_distance = min(distance for distance in distances)  # Find the minimum distance
-                receivers = []
-                for receiver in possible_receivers:  # Copy receivers with min_distance
-                    if len(self.__paths[sender][receiver]) == min_distance:
-                        receivers.append(receiver)
+                receivers = self.get_nearest_receivers(self.__end_systems[sender])
 
-            self.__frames.append(Frame(sender, receivers))  # Add the frame to the list of frames
+            add_frame(self.__end_systems[sender], receivers)  # Add the frame to the table of frames
 
     def add_frame_params(self, periods, per_periods, deadlines=None, sizes=None):
         """
@@ -412,97 +523,18 @@ class Network:
             if len(periods) != len(deadlines):
                 raise ValueError("The deadlines list must be of equal size as the others")
 
-        per_periods = [float(per_period) / sum(per_periods) for per_period in per_periods]  # Normalize percentages
-
-        for i in range(len(self.__frames)):  # For all frames
-            type_period = random()
-            accumulate_period = 0
-            for j, per_period in enumerate(per_periods):
-                if type_period < per_period + accumulate_period:  # Choice one period for the frame
-                    self.__frames[i].set_period(periods[j])  # Set a period to the frame
-                    if deadlines is not None:
-                        self.__frames[i].set_deadline(int(periods[j] * deadlines[j]))  # Set the deadline
-                    else:
-                        self.__frames[i].set_deadline(periods[j])  # If not, deadline = period
-                    if sizes is not None:  # If there are sizes, set it
-                        self.__frames[i].set_size(sizes[j])
-                    break  # Once selected, go out
-                else:
-                    accumulate_period += per_period  # If not, advance in the list
-
-    def __add_dependencies(self, number_dep, max_succ, actual_depth, max_depth, min_time_waiting,
-                           max_time_waiting, min_time_deadline, max_time_deadline, per_waiting, per_deadline, per_both,
-                           pred_frame_index, pred_link):
-        """
-        Fills the dependency tree from its root with a max depth and successors with a recursive function
-        :param number_dep: number of desired dependencies
-        :param max_succ: max successor of dependencies at the tree
-        :param actual_depth: depth of the dependendecy tree in this recursive call
-        :param max_depth: max depth of dependencies at the tree
-        :param min_time_waiting: min time offset desired for waiting dependencies
-        :param min_time_waiting: max time offset desired for waiting dependencies
-        :param min_time_deadline: min time offset desired for deadline dependencies
-        :param max_time_deadline: max time offset desired for deadline dependencies
-        :param per_waiting: percentage of waiting dependencies
-        :param per_deadline: percentage of deadline dependencies
-        :param per_both: percentage of both dependencies
-        :param pred_frame_index: index of the predecessor frame of the dependency
-        :param pred_link: index of the predecessor link of the dependency
-        :return:
-        """
-        for i in range(max_succ):
-            if len(self.__dependencies) == number_dep:  # If we generated enough dependencies
-                break
-            if len(self.__aux_frames) == 0:  # If we cannot generate more dependencies
-                break
-            if random() < ((max_succ - i) / max_succ):  # If lord random wants a successor
-                # Select the successor of the dependency
-                aux_aux_frames = copy.copy(self.__aux_frames)
-                succ_frame = choice(aux_aux_frames)
-                while succ_frame.get_period() != self.__frames[pred_frame_index].get_period() and \
-                    len(aux_aux_frames) != 0 and succ_frame.get_deadline() != \
-                        self.__frames[pred_frame_index].get_deadline():
-                    aux_aux_frames.remove(succ_frame)
-                    succ_frame = choice(aux_aux_frames)
-                if len(aux_aux_frames) == 0:
-                    break
-                succ_frame_index = self.__frames.index(succ_frame)
-                self.__aux_frames.remove(succ_frame)
-                # Get the link of the successor
-                succ_sender = succ_frame.get_sender()
-                succ_receiver = choice(succ_frame.get_receivers())
-                succ_link = self.__paths[succ_sender][succ_receiver][-1]
-                # Get the waiting and/or deadline times
-                random_value = random()
-                if random_value < per_waiting:
-                    wait_time = randint(min_time_waiting, max_time_waiting)
-                    dead_time = 0
-                elif random_value < per_waiting + per_deadline:
-                    wait_time = 0
-                    dead_time = randint(min_time_deadline, max_time_deadline)
-                else:
-                    wait_time = randint(min_time_waiting, max_time_waiting)
-                    dead_time = randint(min_time_deadline, max_time_deadline)
-                # Add the dependency
-                self.__dependencies.append(Dependency(pred_frame_index, pred_link, succ_frame_index, succ_link,
-                                                      wait_time, dead_time))
-
-                if random() < ((max_depth - actual_depth) / max_depth):  # If lord random wants more depth
-                    self.__add_dependencies(number_dep, max_succ, actual_depth + 1, max_depth,
-                                            min_time_waiting, max_time_waiting, min_time_deadline, max_time_deadline,
-                                            per_waiting, per_deadline, per_both, succ_frame_index, succ_link)
-            else:
-                break
+        # Choose the period of every frame, the sampler normalizes the percentages
+        frame_periods = Sampler(per_periods).choose_many(self.__random, len(self.__frames))
+        if deadlines is not None:  # Set the deadline
+            deadlines = [int(period * deadline) for period, deadline in zip(periods, deadlines)]
+        else:  # If not, deadline = period
+            deadlines = periods
+        self.__frames.set_params_by_class(frame_periods, periods, deadlines, sizes)  # Set all the frames at once
 
-    def generate_dependencies(self, number_dep, max_succ, max_depth, min_time_waiting, max_time_waiting,
-                              min_time_deadline, max_time_deadline, per_waiting, per_deadline, per_both):
+    def __check_dependency_parameters(self, number_dep, max_succ, max_depth, min_time_waiting, max_time_waiting,
+                                      min_time_deadline, max_time_deadline, per_waiting, per_deadline, per_both):
         """
-        Generate the dependencies for a given array of frames. It generates roots of dependency trees and call a
-        recursive function to start building the tree.
-        It builds trees until the desired number of dependencies is accomplished or until no more dependencies can be
-        created.
-        It creates two different dependencies (intra/out) with different predefined ranges.
-        Per waiting/deadline/both should be equal to 1.0
+        Checks the parameters to generate dependencies and normalizes the percentages
         :param number_dep: number of desired dependencies
         :param max_succ: max successor of dependencies at the tree
         :param max_depth: max depth of dependencies at the tree
@@ -513,7 +545,7 @@ class Network:
         :param per_waiting: percentage of waiting dependencies
         :param per_deadline: percentage of deadline dependencies
         :param per_both: percentage of both dependencies
-        :return:
+        :return: normalized percentages of waiting, deadline and both dependencies
         """
         # Check if the types and values are correct
         if type(number_dep) != int:
@@ -567,215 +599,734 @@ class Network:
         per_deadline /= sum_per
         per_both /= sum_per
 
-        self.__aux_frames = copy.copy(self.__frames)
+        return per_waiting, per_deadline, per_both
+
+    def __build_dependency_trees(self, number_dep, max_succ, max_depth, min_time_waiting, max_time_waiting,
+                                 min_time_deadline, max_time_deadline, per_waiting, per_deadline, per_both):
+        """
+        Builds dependency trees from random roots and returns every dependency as soon as it is created
+        Every tree is filled in depth first order with an explicit stack instead of a recursive function, so the depth
+        of the trees is not limited by the recursion limit
+        :param number_dep: number of desired dependencies
+        :param max_succ: max successor of dependencies at the tree
+        :param max_depth: max depth of dependencies at the tree
+        :param min_time_waiting: min time offset desired for waiting dependencies
+        :param max_time_waiting: max time offset desired for waiting dependencies
+        :param min_time_deadline: min time offset desired for deadline dependencies
+        :param max_time_deadline: max time offset desired for deadline dependencies
+        :param per_waiting: normalized percentage of waiting dependencies
+        :param per_deadline: normalized percentage of deadline dependencies
+        :param per_both: normalized percentage of both dependencies
+        :return: iterator of dependency objects
+        """
+        num_dependencies = 0
+        # The times are checked once for all the dependencies: if waiting and deadline times are never 0 and the
+        # deadline times are never smaller than the waiting ones, all the dependencies are correct
+        if min_time_waiting > 0 and min_time_deadline > 0 and max_time_waiting <= min_time_deadline:
+            new_dependency = Dependency._from_trusted
+        else:
+            new_dependency = Dependency
+        self.__frame_pool = FramePool(self.__frames.get_periods(), self.__frames.get_deadlines())
         # While there are dependencies to make, or it is not possible to do more
-        while (len(self.__dependencies) < number_dep) and (len(self.__aux_frames) > 0):
-            # Choose predecesor frame and remove it from the frames list
-            pred_frame = choice(self.__aux_frames)
-            pred_frame_index = self.__frames.index(pred_frame)
-            self.__aux_frames.remove(pred_frame)
+        while (num_dependencies < number_dep) and (len(self.__frame_pool) > 0):
+            # Choose predecesor frame and remove it from the frames pool
+            pred_frame_index = self.__frame_pool.pick(self.__random)
             # Get sender and receivers to take the last link of its path
-            pred_sender = pred_frame.get_sender()
-            pred_receiver = choice(pred_frame.get_receivers())
+            pred_sender = self.__frames.get_sender(pred_frame_index)
+            pred_receiver = self.__random.choice(self.__frames.get_receivers(pred_frame_index))
             pred_link = self.__paths[pred_sender][pred_receiver][-1]
-            # Call the recursive function to start building the tree from that root dependency
-            self.__add_dependencies(number_dep, max_succ, 0, max_depth, min_time_waiting, max_time_waiting,
-                                    min_time_deadline, max_time_deadline, per_waiting, per_deadline, per_both,
-                                    pred_frame_index, pred_link)
-            self.__num_dependencies = len(self.__dependencies)
+
+            # Build the tree from that root dependency, every element of the stack is a predecessor with its frame,
+            # link, depth and number of successors already tried
+            stack = [[pred_frame_index, pred_link, 0, 0]]
+            while len(stack) > 0:
+                pred_frame_index, pred_link, actual_depth, i = stack[-1]
+                if i == max_succ or num_dependencies == number_dep or len(self.__frame_pool) == 0:
+                    stack.pop()  # The predecessor cannot have more successors
+                    continue
+                stack[-1][3] += 1
+                if self.__random.random() >= ((max_succ - i) / max_succ):  # If lord random wants no more successors
+                    stack.pop()
+                    continue
+
+                # Select the successor of the dependency, a random frame with the same period or deadline
+                succ_frame_index = self.__frame_pool.pick_matching(self.__random,
+                                                                   self.__frames.get_period(pred_frame_index),
+                                                                   self.__frames.get_deadline(pred_frame_index))
+                if succ_frame_index is None:  # No frame can be the successor
+                    stack.pop()
+                    continue
+                # Get the link of the successor
+                succ_sender = self.__frames.get_sender(succ_frame_index)
+                succ_receiver = self.__random.choice(self.__frames.get_receivers(succ_frame_index))
+                succ_link = self.__paths[succ_sender][succ_receiver][-1]
+                # Get the waiting and/or deadline times
+                random_value = self.__random.random()
+                if random_value < per_waiting:
+                    wait_time = self.__random.randint(min_time_waiting, max_time_waiting)
+                    dead_time = 0
+                elif random_value < per_waiting + per_deadline:
+                    wait_time = 0
+                    dead_time = self.__random.randint(min_time_deadline, max_time_deadline)
+                else:
+                    wait_time = self.__random.randint(min_time_waiting, max_time_waiting)
+                    dead_time = self.__random.randint(min_time_deadline, max_time_deadline)
+                # Return the dependency
+                num_dependencies += 1
+                yield new_dependency(pred_frame_index, pred_link, succ_frame_index, succ_link, wait_time, dead_time)
+
+                if self.__random.random() < ((max_depth - actual_depth) / max_depth):  # If lord random wants more depth
+                    stack.append([succ_frame_index, succ_link, actual_depth + 1, 0])
+
+    def generate_dependencies(self, number_dep, max_succ, max_depth, min_time_waiting, max_time_waiting,
+                              min_time_deadline, max_time_deadline, per_waiting, per_deadline, per_both):
+        """
+        Generate the dependencies for a given array of frames. It generates roots of dependency trees and builds the
+        tree from them.
+        It builds trees until the desired number of dependencies is accomplished or until no more dependencies can be
+        created.
+        It creates two different dependencies (intra/out) with different predefined ranges.
+        Per waiting/deadline/both should be equal to 1.0
+        :param number_dep: number of desired dependencies
+        :param max_succ: max successor of dependencies at the tree
+        :param max_depth: max depth of dependencies at the tree
+        :param min_time_waiting: min time offset desired for waiting dependencies
+        :param max_time_waiting: max time offset desired for waiting dependencies
+        :param min_time_deadline: min time offset desired for deadline dependencies
+        :param max_time_deadline: max time offset desired for deadline dependencies
+        :param per_waiting: percentage of waiting dependencies
+        :param per_deadline: percentage of deadline dependencies
+        :param per_both: percentage of both dependencies
+        :return:
+        """
+        per_waiting, per_deadline, per_both = \
+            self.__check_dependency_parameters(number_dep, max_succ, max_depth, min_time_waiting, max_time_waiting,
+                                               min_time_deadline, max_time_deadline, per_waiting, per_deadline,
+                                               per_both)
+        for dependency in self.__build_dependency_trees(number_dep - len(self.__dependencies), max_succ, max_depth,
+                                                        min_time_waiting, max_time_waiting, min_time_deadline,
+                                                        max_time_deadline, per_waiting, per_deadline, per_both):
+            self.__dependencies.append(dependency)
+        self.__num_dependencies = len(self.__dependencies)
+
+    def iterate_dependencies(self, number_dep, max_succ, max_depth, min_time_waiting, max_time_waiting,
+                             min_time_deadline, max_time_deadline, per_waiting, per_deadline, per_both):
+        """
+        Generate the dependencies as generate_dependencies, but they are returned one by one while they are created and
+        they are not saved in the network, so very large number of dependencies can be written without having all of
+        them in memory (see the dependencies parameter of generate_xml_output)
+        :param number_dep: number of desired dependencies
+        :param max_succ: max successor of dependencies at the tree
+        :param max_depth: max depth of dependencies at the tree
+        :param min_time_waiting: min time offset desired for waiting dependencies
+        :param max_time_waiting: max time offset desired for waiting dependencies
+        :param min_time_deadline: min time offset desired for deadline dependencies
+        :param max_time_deadline: max time offset desired for deadline dependencies
+        :param per_waiting: percentage of waiting dependencies
+        :param per_deadline: percentage of deadline dependencies
+        :param per_both: percentage of both dependencies
+        :return: iterator of dependency objects
+        """
+        per_waiting, per_deadline, per_both = \
+            self.__check_dependency_parameters(number_dep, max_succ, max_depth, min_time_waiting, max_time_waiting,
+                                               min_time_deadline, max_time_deadline, per_waiting, per_deadline,
+                                               per_both)
+        return self.__build_dependency_trees(number_dep, max_succ, max_depth, min_time_waiting, max_time_waiting,
+                                             min_time_deadline, max_time_deadline, per_waiting, per_deadline, per_both)
 
     @staticmethod
-    def __add_param_variable(top, name, value):
+    def __add_param_variable(writer, name, value):
         """
-        Adds a new parameter with a name and a value to the given top of the xml
-        :param top: parent of the parameter
+        Writes a new parameter with a name and a value inside the last open element of the xml
+        :param writer: xml writer of the file
         :param name: name of the parameter
         :param value: value of the parameter
         :return:
         """
-        param = Xml.SubElement(top, 'param')
-        Xml.SubElement(param, 'name').text = name
-        Xml.SubElement(param, 'value').text = str(value)
+        writer.start('param')
+        writer.element('name', name)
+        writer.element('value', value)
+        writer.end()
 
-    def __add_collision_domains_to_xml(self, top):
+    def __add_collision_domains_to_xml(self, writer):
         """
-        Add the collision domains into the xml
-        :param top: parent of the comission domains
+        Writes the collision domains into the xml
+        :param writer: xml writer of the file
         :return: None
         """
-        collision_domains_xml = Xml.SubElement(top, 'collision_domains')
+        writer.start('collision_domains')
         for collision_domain in self.__collision_domains:  # For all the collision domains
-            collision_domain_xml = Xml.SubElement(collision_domains_xml, 'collision_domain')
+            writer.start('collision_domain')
             collision_domain_line = ''
             for link in collision_domain:  # For all the links in the collision domain
                 collision_domain_line += str(link) + ';'
-            Xml.SubElement(collision_domain_xml, 'links').text = collision_domain_line  # Add the links
+            writer.element('links', collision_domain_line)  # Add the links
+            writer.end()
+        writer.end()
 
-    def __add_link_to_xml(self, top, link):
+    def __add_link_to_xml(self, writer, link):
         """
-        Adds a link to the xml as child of the top
-        :param top: parent of the link
-        :param link: link object to be added
+        Writes a link into the xml
+        :param writer: xml writer of the file
+        :param link: index of the link to be added
         :return:
         """
         # Add the link information
-        link_xml = Xml.SubElement(top, 'link')
-        self.__add_param_variable(link_xml, 'speed', link.get_speed())
-        self.__add_param_variable(link_xml, 'type', link.get_type())
+        writer.start('link')
+        self.__add_param_variable(writer, 'speed', self.__topology.get_link_speed(link))
+        self.__add_param_variable(writer, 'type', self.__topology.get_link_type(link))
+        writer.end()
 
-    def __add_frame_to_xml(self, top, frame):
+    def __add_frame_to_xml(self, writer, frame, format_version=1):
         """
-        Adds a frame to the xml as child of the top
+        Writes a frame into the xml
+        :param writer: xml writer of the file
         :param frame: frame object to be added
-        :param top: parent of the frame
+        :param format_version: 1 to write the path to every receiver, 2 to write the multicast tree once
         :return:
         """
         # Add general frame information
-        frame_xml = Xml.SubElement(top, 'frame')
-        self.__add_param_variable(frame_xml, 'period', frame.get_period())
-        self.__add_param_variable(frame_xml, 'deadline', frame.get_deadline())
-        self.__add_param_variable(frame_xml, 'size', frame.get_size())
-
-        # Add the frame pahts
-        path_xml = Xml.SubElement(frame_xml, 'paths')
-        self.__add_param_variable(path_xml, 'num_paths', frame.get_num_receivers())
-        aux_paths = []  # Save the paths to calculate the splits later on
-        aux_path_index = 0
-        for receiver in frame.get_receivers():  # For all the paths
-            path_line = ''
-            aux_paths.append([])  # Init for the current path
-            for link in self.__paths[frame.get_sender()][receiver]:  # For all the links in the path
-                path_line += str(link) + ';'  # Save the link on the path line
-                aux_paths[aux_path_index].append(link)  # Save the link for calculate the split
-            Xml.SubElement(path_xml, 'path').text = path_line  # Adds the path
-            aux_path_index += 1  # Prepare to save new path
-
-        # Add the frame splits
-        splits = self.__calculate_splits(aux_paths)  # Calculate the splits depending on the paths
-        split_xml = Xml.SubElement(frame_xml, 'splits')
-        self.__add_param_variable(split_xml, 'num_splits', str(len(splits)))
-        if len(splits) > 0:  # It there are splits
-            for split in splits:  # For all splits
+        writer.start('frame')
+        self.__add_param_variable(writer, 'period', frame.get_period())
+        self.__add_param_variable(writer, 'deadline', frame.get_deadline())
+        self.__add_param_variable(writer, 'size', frame.get_size())
+
+        # Get the text of the paths and splits, frames with same sender and receivers share them
+        key = self.__frame_cache.get_key(frame.get_sender(), frame.get_receivers())
+        entry = self.__frame_cache.get(key)
+        if entry is None:
+            multicast_tree = MulticastTree(self.__path_engine, frame.get_sender(), frame.get_receivers())
+            path_lines = []
+            if format_version == 1:
+                for receiver in frame.get_receivers():  # For all the paths
+                    path_line = ''
+                    for link in self.__paths[frame.get_sender()][receiver]:  # For all the links in the path
+                        path_line += str(link) + ';'  # Save the link on the path line
+                    path_lines.append(path_line)
+            else:  # Links of the tree in order of level, the link before each of them and the last link to receivers
+                links = [link for level in multicast_tree.get_levels() for link in level]
+                path_lines.append(str(len(links)))
+                path_lines.append(''.join(str(link) + ';' for link in links))
+                path_lines.append(''.join(str(-1 if multicast_tree.get_parent_link(link) is None else
+                                              multicast_tree.get_parent_link(link)) + ';' for link in links))
+                path_lines.append(''.join(str(self.__path_engine.get_down_link(receiver)) + ';' for receiver in
+                                          frame.get_receivers()))
+
+            # Calculate the splits, read from the union of the paths of the frame
+            split_lines = []
+            for split in multicast_tree.get_splits():
                 split_line = ''
                 for link in split:  # For all links on the split
                     split_line += str(link) + ';'
-                Xml.SubElement(split_xml, 'split').text = split_line  # Adds the split
+                split_lines.append(split_line)
+            entry = (path_lines, split_lines)
+            self.__frame_cache.add(key, entry, len(path_lines) + len(split_lines))
+        path_lines, split_lines = entry
+
+        if format_version == 1:  # Add the frame pahts
+            writer.start('paths')
+            self.__add_param_variable(writer, 'num_paths', frame.get_num_receivers())
+            for path_line in path_lines:  # For all the paths
+                writer.element('path', path_line)  # Adds the path
+            writer.end()
+        else:  # Add the frame multicast tree
+            writer.start('tree')
+            self.__add_param_variable(writer, 'num_links', path_lines[0])
+            writer.element('links', path_lines[1])
+            writer.element('parent_links', path_lines[2])
+            self.__add_param_variable(writer, 'num_receivers', frame.get_num_receivers())
+            writer.element('receiver_links', path_lines[3])
+            writer.end()
 
-    def __add_dependency_to_xml(self, top, dependency):
+        # Add the frame splits
+        writer.start('splits')
+        self.__add_param_variable(writer, 'num_splits', len(split_lines))
+        for split_line in split_lines:  # For all splits
+            writer.element('split', split_line)  # Adds the split
+        writer.end()
+        writer.end()
+
+    def __add_dependency_to_xml(self, writer, dependency):
         """
-        Add a dependency to the xml as child of the top
-        :param top: parent of the frame
+        Writes a dependency into the xml
+        :param writer: xml writer of the file
         :param dependency: dependency object to be added
         :return:
         """
         # Write dependency params
-        dependency_xml = Xml.SubElement(top, 'dependency')
-        self.__add_param_variable(dependency_xml, 'pred_frame', dependency.get_pred_frame())
-        self.__add_param_variable(dependency_xml, 'pred_link', dependency.get_pred_link())
-        self.__add_param_variable(dependency_xml, 'succ_frame', dependency.get_succ_frame())
-        self.__add_param_variable(dependency_xml, 'succ_link', dependency.get_succ_link())
-        self.__add_param_variable(dependency_xml, 'waiting_time', dependency.get_waiting_time())
-        self.__add_param_variable(dependency_xml, 'deadline_time', dependency.get_deadline_time())
-
-    def generate_xml_output(self, name):
+        writer.start('dependency')
+        self.__add_param_variable(writer, 'pred_frame', dependency.get_pred_frame())
+        self.__add_param_variable(writer, 'pred_link', dependency.get_pred_link())
+        self.__add_param_variable(writer, 'succ_frame', dependency.get_succ_frame())
+        self.__add_param_variable(writer, 'succ_link', dependency.get_succ_link())
+        self.__add_param_variable(writer, 'waiting_time', dependency.get_waiting_time())
+        self.__add_param_variable(writer, 'deadline_time', dependency.get_deadline_time())
+        writer.end()
+
+    def generate_xml_output(self, name, cache_size=262144, indent="   ", dependencies=None, format_version=1):
         """
         Generates an xml file with all the information of the generated network for the scheduler
+        The file is written while the frames and dependencies are visited, so the whole document is never in memory
+        In the format version 2, instead of the path to every receiver, every frame has its multicast tree: the links
+        of the union of its paths (in order of position in the paths), the link before every one of them in the paths
+        (-1 if it leaves the sender) and the last link of the path to every receiver (in order of receivers). The path
+        to a receiver is found following the links before its last link until the sender
         :param name: name of the xml file
+        :param cache_size: max number of paths and splits text lines kept for the frames with the same sender and
+        receivers, every broadcast frame takes one line per end system so large networks may need a larger value
+        :param indent: text to indent every level of the xml, None to write it without new lines
+        :param dependencies: iterable of dependencies to write instead of the ones of the network (as the iterator
+        returned by iterate_dependencies), None to write the ones of the network
+        :param format_version: 1 to write the path to every receiver, 2 to write the multicast tree of every frame
         :return: None
         """
         # Check if name if the types and values are correct
         if type(name) != str:
             raise TypeError("The name must be a string")
+        if type(format_version) != int:
+            raise TypeError("The format version must be an integer")
+        if format_version != 1 and format_version != 2:
+            raise ValueError("The format version must be 1 or 2")
+        self.__frame_cache = FrameCache(cache_size)
 
-        # Create top of the xml file
-        schedule_input = Xml.Element('schedule_input')
+        with open(name, "w") as f:
+            # Create top of the xml file
+            writer = XmlWriter(f, indent)
+            writer.start('schedule_input')
+
+            # Write the general info of the network
+            writer.start('network_params')
+            self.__add_param_variable(writer, 'number_frames', len(self.__frames))
+            self.__add_param_variable(writer, 'number_links', self.__topology.get_number_links())
+            if format_version != 1:
+                self.__add_param_variable(writer, 'format_version', format_version)
+            writer.end()
+
+            # Write the collision domains information
+            self.__add_collision_domains_to_xml(writer)
+
+            # Write the information of the links
+            writer.start('link_params')
+            for link in range(self.__topology.get_number_links()):
+                self.__add_link_to_xml(writer, link)
+            writer.end()
+
+            # Write the information of the frames
+            writer.start('frame_params')
+            for frame in self.__frames:
+                self.__add_frame_to_xml(writer, frame, format_version)
+            writer.end()
+
+            # Write the information of the dependencies
+            writer.start('dependency_params')
+            if dependencies is None:
+                dependencies = self.__dependencies
+            for dependency in dependencies:
+                self.__add_dependency_to_xml(writer, dependency)
+            writer.end()
+
+            writer.close()
+
+    def generate_binary_output(self, name, cache_size=262144, dependencies=None):
+        """
+        Generates an array file (see the array file class) with the same information as the xml output, it can be
+        opened with ArrayFile(name) without reading the arrays. Offsets and times are 64 bits integers, links, nodes and
+        speeds are 32 bits integers and the link types are bytes.
+        Lists of lists are saved in two arrays, the values of all the lists one after the other and the offsets with
+        the position where every list starts (and one more position at the end), so the list i is
+        values[offsets[i]:offsets[i + 1]]. Paths and splits have two levels, the paths of the frame i are the paths
+        frame_path_offsets[i] to frame_path_offsets[i + 1] and the links of the path j are path_links[
+        path_link_offsets[j]:path_link_offsets[j + 1]] (the same for the splits)
+        Arrays:
+            network_params: number of frames and number of links
+            link_speeds, link_types: speed and LinkType value of every link
+            collision_domain_offsets, collision_domain_links: links of every collision domain
+            frame_periods, frame_deadlines, frame_sizes, frame_senders: values of every frame
+            frame_receiver_offsets, frame_receivers: receivers of every frame
+            frame_path_offsets, path_link_offsets, path_links: path to every receiver of every frame
+            frame_split_offsets, split_link_offsets, split_links: splits of every frame
+            dependency_pred_frames, dependency_pred_links, dependency_succ_frames, dependency_succ_links,
+            dependency_waiting_times, dependency_deadline_times: values of every dependency
+        :param name: name of the file
+        :param cache_size: max number of paths and splits kept for the frames with the same sender and receivers,
+        every broadcast frame takes one path per end system so large networks may need a larger value
+        :param dependencies: iterable of dependencies to write instead of the ones of the network (as the iterator
+        returned by iterate_dependencies), None to write the ones of the network
+        :return: None
+        """
+        # Check if the types and values are correct
+        if type(name) != str:
+            raise TypeError("The name must be a string")
+        self.__frame_cache = FrameCache(cache_size)
 
-        # Write the general info of the network
-        network_params = Xml.SubElement(schedule_input, 'network_params')
-        self.__add_param_variable(network_params, 'number_frames', len(self.__frames))
-        self.__add_param_variable(network_params, 'number_links', len(self.__links))
+        num_links = self.__topology.get_number_links()
+        collision_domain_offsets = array('q', [0])
+        collision_domain_links = array('i')
+        for collision_domain in self.__collision_domains:  # For all the collision domains
+            collision_domain_links.extend(collision_domain)
+            collision_domain_offsets.append(len(collision_domain_links))
+
+        frame_receiver_offsets = array('q', [0])
+        frame_receivers = array('i')
+        frame_path_offsets = array('q', [0])
+        path_link_offsets = array('q', [0])
+        path_links = array('i')
+        frame_split_offsets = array('q', [0])
+        split_link_offsets = array('q', [0])
+        split_links = array('i')
+        for index in range(len(self.__frames)):  # For all the frames
+            sender = self.__frames.get_sender(index)
+            receivers = self.__frames.get_receivers(index)
+            frame_receivers.extend(receivers)
+            frame_receiver_offsets.append(len(frame_receivers))
+
+            # Get the paths and splits, frames with same sender and receivers share them
+            key = self.__frame_cache.get_key(sender, receivers)
+            entry = self.__frame_cache.get(key)
+            if entry is None:
+                paths = [list(self.__paths[sender][receiver]) for receiver in receivers]
+                splits = MulticastTree(self.__path_engine, sender, receivers).get_splits()
+                entry = (paths, splits)
+                self.__frame_cache.add(key, entry, len(paths) + len(splits))
+            paths, splits = entry
+
+            for path in paths:
+                path_links.extend(path)
+                path_link_offsets.append(len(path_links))
+            frame_path_offsets.append(len(path_link_offsets) - 1)
+            for split in splits:
+                split_links.extend(split)
+                split_link_offsets.append(len(split_links))
+            frame_split_offsets.append(len(split_link_offsets) - 1)
+
+        dependency_columns = [array(type_code) for type_code in 'iiiiqq']
+        if dependencies is None:
+            dependencies = self.__dependencies
+        for dependency in dependencies:  # For all the dependencies
+            for column, value in zip(dependency_columns, (dependency.get_pred_frame(), dependency.get_pred_link(),
+                                                          dependency.get_succ_frame(), dependency.get_succ_link(),
+                                                          dependency.get_waiting_time(),
+                                                          dependency.get_deadline_time())):
+                column.append(value)
+
+        ArrayFile.write(name, [
+            ('network_params', array('q', [len(self.__frames), num_links])),
+            ('link_speeds', array('i', [self.__topology.get_link_speed(link) for link in range(num_links)])),
+            ('link_types', array('B', [self.__topology.get_link_type(link).value for link in range(num_links)])),
+            ('collision_domain_offsets', collision_domain_offsets),
+            ('collision_domain_links', collision_domain_links),
+            ('frame_periods', array('q', self.__frames.get_periods())),
+            ('frame_deadlines', array('q', self.__frames.get_deadlines())),
+            ('frame_sizes', array('q', self.__frames.get_sizes())),
+            ('frame_senders', array('i', self.__frames.get_senders())),
+            ('frame_receiver_offsets', frame_receiver_offsets),
+            ('frame_receivers', frame_receivers),
+            ('frame_path_offsets', frame_path_offsets),
+            ('path_link_offsets', path_link_offsets),
+            ('path_links', path_links),
+            ('frame_split_offsets', frame_split_offsets),
+            ('split_link_offsets', split_link_offsets),
+            ('split_links', split_links),
+            ('dependency_pred_frames', dependency_columns[0]),
+            ('dependency_pred_links', dependency_columns[1]),
+            ('dependency_succ_frames', dependency_columns[2]),
+            ('dependency_succ_links', dependency_columns[3]),
+            ('dependency_waiting_times', dependency_columns[4]),
+            ('dependency_deadline_times', dependency_columns[5])])
 
-        # Write the collision domains information
-        self.__add_collision_domains_to_xml(schedule_input)
+    @staticmethod
+    def __read_params_from_xml(element):
+        """
+        Reads the parameters inside an element of the xml output
+        :param element: element of the xml
+        :return: dictionary with the name of every parameter as key and its text as value
+        """
+        return {param.findtext('name'): param.findtext('value') for param in element.iterfind('param')}
 
-        # Write the information of the links
-        links_params = Xml.SubElement(schedule_input, 'link_params')
-        for link in self.__links_container:
-            self.__add_link_to_xml(links_params, link)
+    @staticmethod
+    def __get_int_param(params, name):
+        """
+        Gets an integer parameter read from the xml output
+        :param params: dictionary with the name of every parameter as key and its text as value
+        :param name: name of the parameter
+        :return: value of the parameter
+        """
+        value = params.get(name)
+        if value is None:
+            raise ValueError("The file is not a network output, the parameter " + name + " is missing")
+        return int(value)
 
-        # Write the information of the frames
-        frames_params = Xml.SubElement(schedule_input, 'frame_params')
-        for frame in self.__frames:
-            self.__add_frame_to_xml(frames_params, frame)
+    @staticmethod
+    def __read_links_from_xml(text):
+        """
+        Reads a list of links of the xml output (separated and finished by ;)
+        :param text: text of the element
+        :return: list with the links
+        """
+        if text is None:
+            return []
+        return [int(link) for link in text.split(';') if link != '']
 
-        # Write the information of the dependencies
-        dependency_params = Xml.SubElement(schedule_input, 'dependency_params')
-        for dependency in self.__dependencies:
-            self.__add_dependency_to_xml(dependency_params, dependency)
+    @staticmethod
+    def __find_group(groups, node):
+        """
+        Finds the group of a node, every group is identified by one of its nodes
+        :param groups: array with a node of the same group for every node
+        :param node: id of the node
+        :return: id of the node that identifies the group
+        """
+        while groups[node] != node:
+            groups[node] = groups[groups[node]]  # Shorten the way for the next time
+            node = groups[node]
+        return node
 
-        # Write the final file
-        xmlstr = minidom.parseString(Xml.tostring(schedule_input)).toprettyxml(indent="   ")
-        with open(name, "w") as f:
-            f.write(xmlstr)
+    @staticmethod
+    def __set_parent(parents, node, parent):
+        """
+        Sets the parent found for a node
+        :param parents: array with the parent of every node, -1 if it is still unknown
+        :param node: id of the node
+        :param parent: id of the parent node
+        :return: 1 if the parent was unknown, 0 if not
+        """
+        if parents[node] == parent:
+            return 0
+        if parents[node] != -1:
+            raise ValueError("The paths of the file do not belong to a network without cycles")
+        parents[node] = parent
+        return 1
+
+    def __add_consecutive_links(self, parents, groups, link, next_link):
+        """
+        Saves what two consecutive links of a path tell about the parents of the nodes
+        The link 2k goes down from the parent of the node k + 1 and the link 2k + 1 goes up from it. Two up links mean
+        the second node is the parent of the first one, two down links mean the first node is the parent of the second
+        one and an up link followed by a down link mean both nodes have the same parent (saved in the same group if it
+        is still unknown)
+        :param parents: array with the parent of every node, -1 if it is still unknown
+        :param groups: array with a node of the same group for every node
+        :param link: index of the link
+        :param next_link: index of the next link in the path
+        :return: number of nodes whose parent was unknown
+        """
+        node = link // 2 + 1
+        next_node = next_link // 2 + 1
+        if link < 0 or next_link < 0 or node >= len(parents) or next_node >= len(parents):
+            raise ValueError("Some path of the file has a link that is not in the network")
+        if link % 2 == 1 and next_link % 2 == 1:
+            return self.__set_parent(parents, node, next_node)
+        if link % 2 == 0 and next_link % 2 == 0:
+            return self.__set_parent(parents, next_node, node)
+        if link % 2 == 0:
+            raise ValueError("The paths of the file do not belong to a network without cycles")
+        if parents[node] != -1:
+            return self.__set_parent(parents, next_node, parents[node])
+        if parents[next_node] != -1:
+            return self.__set_parent(parents, node, parents[next_node])
+        groups[self.__find_group(groups, node)] = self.__find_group(groups, next_node)
+        return 0
+
+    def __read_frame_from_xml(self, element, parents, groups):
+        """
+        Reads a frame of the xml output and adds it to the network
+        The sender is the node of the first link (up) of the paths and the receivers the nodes of the last links (down)
+        :param element: element of the frame
+        :param parents: array with the parent of every node, -1 if it is still unknown, None to not find parents
+        :param groups: array with a node of the same group for every node
+        :return: number of nodes whose parent was unknown
+        """
+        found = 0
+        tree = element.find('tree')
+        if tree is None:  # Format version 1, a path to every receiver
+            path_lines = [path.text or '' for path in element.iterfind('paths/path')]
+            if parents is not None:
+                for path_line in path_lines:
+                    path = self.__read_links_from_xml(path_line)
+                    for link, next_link in zip(path, path[1:]):
+                        found += self.__add_consecutive_links(parents, groups, link, next_link)
+            # Only the first and last links are needed (the text always finishes with ;)
+            sender_links = [int(path_line.split(';', 1)[0]) for path_line in path_lines]
+            receiver_links = [int(path_line.rstrip(';').rsplit(';', 1)[-1]) for path_line in path_lines]
+        else:  # Format version 2, the multicast tree with the link before every link
+            links_line = tree.findtext('links') or ''
+            if parents is not None:
+                links = self.__read_links_from_xml(links_line)
+                parent_links = self.__read_links_from_xml(tree.findtext('parent_links'))
+                for link, parent_link in zip(links, parent_links):
+                    if parent_link != -1:
+                        found += self.__add_consecutive_links(parents, groups, parent_link, link)
+            # The first link of the tree is the only one that leaves the sender
+            sender_links = [int(links_line.split(';', 1)[0])]
+            receiver_links = self.__read_links_from_xml(tree.findtext('receiver_links'))
+        if len(receiver_links) == 0:
+            raise ValueError("Some frame of the file has no receivers")
+        if any(link % 2 == 0 for link in sender_links) or any(link % 2 == 1 for link in receiver_links):
+            raise ValueError("Some frame does not go up from its sender and down to its receivers")
+
+        params = self.__read_params_from_xml(element)
+        self.__frames.add_frame(sender_links[0] // 2 + 1, [link // 2 + 1 for link in receiver_links],
+                                self.__get_int_param(params, 'period'), self.__get_int_param(params, 'deadline'),
+                                self.__get_int_param(params, 'size'))
+        return found
+
+    def read_xml_output(self, name, network_description=None):
+        """
+        Reads a network from an xml file written by generate_xml_output (format version 1 or 2), with its links,
+        collision domains, frames and dependencies. The paths are generated again from the topology
+        The file is read element by element and every element of the lists is cleared once it is read, so the whole
+        document is never in memory
+        The file does not have the parents of the nodes, so they are found from the paths of the frames (the up link of
+        a node followed by the up link of another node means the second one is the parent, etc.) until all of them are
+        known. If some node is not in any path its parent cannot be known, and the network description used to create
+        the network is needed
+        :param name: name of the xml file
+        :param network_description: description of the network used to create it, None to find the parents from
+        the paths
+        :return: None
+        """
+        # Check if the types and values are correct
+        if type(name) != str:
+            raise TypeError("The name must be a string")
+        if network_description is not None and type(network_description) != str:
+            raise TypeError("The network description must be a string")
+
+        # Read it into a new network, so this one is only changed if the whole file is correct
+        network = Network(self.__seed)
+        network.__read_xml_output(name, network_description)
+        vars(self).update(vars(network))
+
+    def __read_xml_output(self, name, network_description):
+        """
+        Reads a network from an xml file written by generate_xml_output, see read_xml_output
+        :param name: name of the xml file
+        :param network_description: description of the network used to create it, None to find the parents from
+        the paths
+        :return: None
+        """
+        from xml.etree.ElementTree import iterparse, ParseError
+
+        network_params = {}
+        link_params = []
+        parents = None
+        groups = None
+        unknown_parents = 0  # Number of nodes whose parent is still unknown
+        depth = 0
+        section = None  # Element with the list that is being read (frames, dependencies...)
+        try:
+            for event, element in iterparse(name, events=('start', 'end')):
+                if event == 'start':
+                    depth += 1
+                    if depth == 2:
+                        section = element
+                    continue
+                depth -= 1
+                if depth != 2:  # Only the elements of the lists are read, the rest are read inside them
+                    continue
+
+                if section.tag == 'network_params':
+                    network_params[element.findtext('name')] = element.findtext('value')
+                elif section.tag == 'collision_domains':
+                    self.__collision_domains.append(self.__read_links_from_xml(element.findtext('links')))
+                elif section.tag == 'link_params':
+                    params = self.__read_params_from_xml(element)
+                    link_type = LinkType.__members__.get(str(params.get('type')).split('.')[-1])
+                    if link_type is None:
+                        raise ValueError("The file is not a network output, some link has no valid type")
+                    link_params.append((link_type, self.__get_int_param(params, 'speed')))
+                elif section.tag == 'frame_params':
+                    if groups is None and network_description is None:  # The links are known, prepare the parents
+                        parents = array('l', [-1]) * (len(link_params) // 2 + 1)
+                        groups = array('l', range(len(parents)))
+                        if len(parents) > 1:
+                            parents[1] = 0  # The first node created after the root is always its child
+                        unknown_parents = len(parents) - 2
+                    found = self.__read_frame_from_xml(element, parents if unknown_parents > 0 else None, groups)
+                    unknown_parents -= found
+                elif section.tag == 'dependency_params':
+                    params = self.__read_params_from_xml(element)
+                    self.__dependencies.append(Dependency(*[self.__get_int_param(params, param) for param in
+                                                            ('pred_frame', 'pred_link', 'succ_frame', 'succ_link',
+                                                             'waiting_time', 'deadline_time')]))
+                section.clear()  # The element is already read
+
+            # Check the number of links and frames
+            if len(link_params) != self.__get_int_param(network_params, 'number_links') or len(link_params) % 2 != 0:
+                raise ValueError("The number of links of the file is not correct")
+            if len(self.__frames) != self.__get_int_param(network_params, 'number_frames'):
+                raise ValueError("The number of frames of the file is not correct")
+        except ParseError:
+            raise ValueError("Could not read the xml file")
+        number_nodes = len(link_params) // 2 + 1
+
+        # Find the parent and type of every node
+        if network_description is not None:  # Create the network described to read them
+            network = Network()
+            network.create_network(network_description)
+            topology = network.get_topology()
+            if topology.get_number_links() != len(link_params):
+                raise ValueError("The network description does not have the number of links of the file")
+            parents = [topology.get_parent(node) for node in range(number_nodes)]
+            node_types = [topology.get_node_type(node) for node in range(number_nodes)]
+        else:  # Give to every node the parent found for any node of its group
+            if groups is None:  # There are no frames
+                parents = array('l', [-1]) * number_nodes
+                groups = array('l', range(number_nodes))
+                if number_nodes > 1:
+                    parents[1] = 0
+            group_parents = {}
+            for node in range(1, number_nodes):
+                if parents[node] != -1:
+                    group = self.__find_group(groups, node)
+                    if group_parents.setdefault(group, parents[node]) != parents[node]:
+                        raise ValueError("The paths of the file do not belong to a network without cycles")
+            for node in range(1, number_nodes):
+                if parents[node] == -1:
+                    parents[node] = group_parents.get(self.__find_group(groups, node), -1)
+                    if parents[node] == -1:
+                        raise ValueError("The node " + str(node) + " is not in any path, the network description is "
+                                                                    "needed to know its parent")
+            node_types = [NodeType.end_system] * number_nodes
+            node_types[0] = NodeType.switch
+            for node in range(1, number_nodes):  # The nodes with children are switches, the leafs end systems
+                node_types[parents[node]] = NodeType.switch
+
+        # Create the nodes in the same order, every node has the description of the link that goes down to it
+        self.__add_switch()
+        for node in range(1, number_nodes):
+            if node_types[node] == NodeType.switch:
+                self.__add_switch(parents[node], link_params[2 * (node - 1)])
+            else:
+                self.__add_end_system(parents[node], link_params[2 * (node - 1)])
+        self.__num_dependencies = len(self.__dependencies)
+        self.generate_paths()
 
     @staticmethod
-    def get_network_description_from_xml(name, num_network):
+    def __read_xml_root(name):
         """
-        Returns the network description (including the link description if exist) from the xml file
+        Reads the xml file and returns its root
         :param name: name of the xml file
-        :param num_network: position of the network in the xml to read
-        :return: array with network description and array with link description (formated to work in the network
-        function)
+        :return: root element of the xml
         """
+        import xml.etree.ElementTree as Xml  # Imported when needed, to start faster in the worker processes
+
         try:  # Try to open the file
             tree = Xml.parse(name)
         except:
             raise Exception("Could not read the xml file")
-        root = tree.getroot()
+        return tree.getroot()
 
+    @staticmethod
+    def get_network_description_from_xml(name, num_network):
+        """
+        Returns the network description (including the link description if exist) from the xml file
+        :param name: name of the xml file
+        :param num_network: position of the network in the xml to read
+        :return: array with network description and array with link description (formated to work in the network
+        function)
+        """
+        root = Network.__read_xml_root(name)
         networks_description_xml = root.findall('netgen_params/network_description')  # Position the branch
-        network_description_xml = networks_description_xml[num_network]
-        network_description_line = ''
-        link_info_line = ''
-        links_found = False
-
-        for difurcation in network_description_xml.findall('difurcation'):  # For all difurcations found
-            network_description_line += difurcation.find('value').text + ';'
-            value = int(difurcation.find('value').text)
-            links_xml = difurcation.find('links')
-            links_counter = 0
-            links_found = False
-            if links_xml is not None:  # See if there is also links description
-                links_found = True
-                for link_xml in links_xml.findall('link'):  # For all links information
-                    links_counter += 1
-
-                    # Save the type information and check if is correct
-                    link_type = link_xml.find('type').text
-                    if link_type == 'wired':
-                        link_info_line += 'w'
-                    elif link_type == 'wireless':
-                        link_info_line += 'x'
-                    else:
-                        raise TypeError('The type of the link is not wired neither wireless')
-
-                    # Save the speed of the link and check if is correct
-                    speed = link_xml.find('speed').text
-                    try:
-                        speed = int(speed)
-                    except ValueError:
-                        raise TypeError('The speed is not an integer')
-                    if speed <= 0:
-                        raise ValueError('The speed should be larger than 0')
-                    link_info_line += str(speed) + ';'
-
-            if abs(value) != links_counter:
-                raise ValueError('The number of links is incorrect, they should be the same as the difurcations')
-
-        if not links_found:
-            return network_description_line[0:-1], None
-        else:
-            return network_description_line[0:-1], link_info_line[0:-1]
+        return SweepConfig.read_network_description(networks_description_xml[num_network])
 
     @staticmethod
     def get_collision_domains_xml(name, col_dom):
@@ -785,20 +1336,9 @@ class Network:
         :param col_dom: position of the collision domain to read
         :return: the matrix of collision domains
         """
-        try:  # Try to open the file
-            tree = Xml.parse(name)
-        except:
-            raise Exception("Could not read the xml file")
-        root = tree.getroot()
-
+        root = Network.__read_xml_root(name)
         collisions_domains_xml = root.findall('netgen_params/collision_domains')  # Position the branch
-        collision_domains_xml = collisions_domains_xml[col_dom]
-        collision_domain = []
-        for collision_domain_xml in collision_domains_xml.findall('collision_domain'):  # For all collision domains
-            links = collision_domain_xml.find('links').text
-            collision_domain.append([int(link) for link in links.split(';')])  # Save into the matrix
-
-        return collision_domain
+        return SweepConfig.read_collision_domains(collisions_domains_xml[col_dom])
 
     @staticmethod
     def get_frames_description_from_xml(name):
@@ -807,34 +1347,8 @@ class Network:
         :param name: name of the xml file
         :return: number of frames, percentages of broadcast, single, multi and locally frames
         """
-        try:  # Try to open the file
-            tree = Xml.parse(name)
-        except:
-            raise Exception("Could not read the xml file")
-        root = tree.getroot()
-
-        parameters_xml = root.find('netgen_params/frame_types')
-        num_frames = []
-        frame_parameters = []
-        first = True
-        for parameter_xml in parameters_xml.findall('param'):  # For all the parameters
-            try:  # Save the parameters and check if the values are correct
-                if first:
-                    first = False
-                    for n in parameter_xml.findall('value'):
-                        num_frames.append(int(n.text))
-                else:
-                    frame_parameters.append([])
-                    for n in parameter_xml.findall('value'):
-                        frame_parameters[-1].append(float(n.text))
-                        if frame_parameters[-1][-1] < 0.0:
-                            raise ValueError('The percentages should be 0 or positive')
-            except:
-                raise TypeError('The types are incorrect')
-            if not all(num_frames) > 0:
-                raise ValueError('The number of frames should be positive')
-
-        return num_frames, frame_parameters
+        root = Network.__read_xml_root(name)
+        return SweepConfig.read_frames_description(root.find('netgen_params/frame_types'))
 
     @staticmethod
     def get_frames_variables_from_xml(name, num_variable):
@@ -844,41 +1358,9 @@ class Network:
         :param num_variable: posision of the num variable
         :return: lists of periods, percentage periods, deadlines and sizes
         """
-        try:  # Try to open the file
-            tree = Xml.parse(name)
-        except:
-            raise Exception("Could not read the xml file")
-        root = tree.getroot()
-
-        # Init the lists needed to return
-        period = []
-        per_period = []
-        deadline = []
-        size = []
-        deadlines = False
-        sizes = False
-
+        root = Network.__read_xml_root(name)
         multiple_variables_xml = root.findall('netgen_params/frame_variables')
-        variables_xml = multiple_variables_xml[num_variable]
-        for parameter_xml in variables_xml.findall('variable'):  # For all parameters
-            period.append(int(parameter_xml.find('period').text))  # Save the period
-            per_period.append(float(parameter_xml.find('per_period').text))  # Save the percentage
-            if parameter_xml.find('deadline') is not None:  # Save the deadline if exists
-                deadlines = True
-                deadline.append(float(parameter_xml.find('deadline').text))
-            if parameter_xml.find('deadline') is not None:  # Save the size if exists
-                size.append(int(parameter_xml.find('size').text))
-                sizes = True
-
-        # See what do we have to return
-        if deadlines and sizes:
-            return period, per_period, deadline, size
-        elif deadlines and not sizes:
-            return period, per_period, deadline, None
-        elif not deadlines and sizes:
-            return period, per_period, None, size
-        else:
-            return period, per_period, None, None
+        return SweepConfig.read_frame_variables(multiple_variables_xml[num_variable])
 
     @staticmethod
     def get_dependencies_variables_from_xml(name, num_variable):
@@ -888,28 +1370,9 @@ class Network:
         :param num_variable: position of the num dependency
         :return: dependency variables
         """
-        try:  # Try to open the file
-            tree = Xml.parse(name)
-        except:
-            raise Exception("Could not read the xml file")
-        root = tree.getroot()
-
+        root = Network.__read_xml_root(name)
         multiple_variables_xml = root.findall('netgen_params/dependency_variables')
-        variables_xml = multiple_variables_xml[num_variable]
-        parameter_xml = variables_xml.find('variable')
-        num_dep = int(parameter_xml.find('num_dep').text)
-        max_succ = int(parameter_xml.find('max_succ').text)
-        max_dep = int(parameter_xml.find('max_dep').text)
-        min_time_waiting = int(parameter_xml.find('min_time_waiting').text)
-        max_time_waiting = int(parameter_xml.find('max_time_waiting').text)
-        min_time_deadline = int(parameter_xml.find('min_time_deadline').text)
-        max_time_deadline = int(parameter_xml.find('max_time_deadline').text)
-        per_waiting = float(parameter_xml.find('per_waiting').text)
-        per_deadline = float(parameter_xml.find('per_deadline').text)
-        per_both = float(parameter_xml.find('per_both').text)
-
-        return num_dep, max_succ, max_dep, min_time_waiting, max_time_waiting, min_time_deadline, max_time_deadline, \
-            per_waiting, per_deadline, per_both
+        return SweepConfig.read_dependency_variables(multiple_variables_xml[num_variable])
 
     @staticmethod
     def __autohash(key):
@@ -928,51 +1391,100 @@ class Network:
         h %= c
         return h
 
-    def create_network_from_xml(self, name):
+    @staticmethod
+    def create_topology(network, link, collision_domains):
+        """
+        Creates a network with only its topology, paths and collision domains, to fork the sweep combinations from it
+        :param network: network description
+        :param link: link description
+        :param collision_domains: matrix of collision domains
+        :return: network object
+        """
+        network_object = Network()
+        network_object.create_network(network, link)
+        network_object.generate_paths()
+        network_object.define_collision_domains(collision_domains)
+        return network_object
+
+    @staticmethod
+    def generate_combination(network, link, collision_domains, num_frame, frame_percentages, frame_variables,
+                             dependency_variables, name, seed=None):
+        """
+        Creates one network of the sweep with its own network object and writes it in the networks/name directory
+        The network is forked from the topology of its description, that is created once per process, so it can be
+        executed in a different process
+        :param network: network description
+        :param link: link description
+        :param collision_domains: matrix of collision domains
+        :param num_frame: number of frames
+        :param frame_percentages: tuple with the percentages of broadcast, single, locally and multi frames
+        :param frame_variables: tuple with the periods, percentage periods, deadlines and sizes
+        :param dependency_variables: tuple with the dependency variables
+        :param name: name of the directory and xml file of the network
+        :param seed: seed of the random generator of the network, the same seed always creates the same network
+        :return: None
+        """
+        per_broadcast, per_single, per_locally, per_multi = frame_percentages
+        periods, per_periods, deadlines, sizes = frame_variables
+        num_dep, max_succ, max_dep, min_time_waiting, max_time_waiting, min_time_deadline, max_time_deadline, \
+            per_waiting, per_deadline, per_both = dependency_variables
+
+        # All the combinations of a network description share the topology, it is only created the first time in every
+        # process (the combinations of the same network are created one after the other)
+        key = (network, link, tuple(tuple(collision_domain) for collision_domain in collision_domains))
+        topology = Network.__topology_cache.get(key)
+        if topology is None:
+            Network.__topology_cache.clear()  # Only keep the last one, so the memory does not grow with the sweep
+            topology = Network.create_topology(network, link, collision_domains)
+            Network.__topology_cache[key] = topology
+        network_object = topology.fork(seed)
+        network_object.generate_frames(num_frame, per_broadcast, per_single, per_locally, per_multi)
+        network_object.add_frame_params(periods, per_periods, deadlines, sizes)
+        network_object.generate_dependencies(num_dep, max_succ, max_dep, min_time_waiting, max_time_waiting,
+                                             min_time_deadline, max_time_deadline, per_waiting, per_deadline, per_both)
+        os.makedirs("networks/" + name)
+        os.makedirs("networks/" + name + "/schedules")
+        network_object.generate_xml_output("networks/" + name + "/" + name)
+
+    def create_network_from_xml(self, name, workers=1, seed=None):
         """
         Create the network from the information from the xml
+        Every combination of parameters is created with its own network object, so they can be executed in parallel
         :param name: name of the xml file
+        :param workers: number of processes to create the networks, 1 to create them in this process, None to use all
+        the processors of the computer
+        :param seed: seed added to the parameters of every combination to get its own seed, with the same seed the
+        same networks are always created
         :return: None
         """
-        try:  # Try to open the file
-            tree = Xml.parse(name)
-        except:
-            raise Exception("Could not read the xml file")
+        # Check if the types and values are correct
+        if workers is not None:
+            if type(workers) != int:
+                raise TypeError("The number of workers must be an integer")
+            if workers <= 0:
+                raise ValueError("The number of workers must be a positive integer")
+
+        config = SweepConfig(name)  # Read all the parameters only once
         try:
             os.makedirs("networks")
         except FileExistsError:  # If the directory exists
+            import shutil
             shutil.rmtree('networks')
             os.makedirs("networks")
-        root = tree.getroot()
-        num_network_description_xml = len(root.findall('netgen_params/network_description'))  # Numbers of network
-        num_collision_domains_xml = len(root.findall('netgen_params/collision_domains'))
-        if num_collision_domains_xml != num_network_description_xml:
-            raise Exception('Every network description should have its collision domain')
-        num_variables_xml = len(root.findall('netgen_params/frame_variables'))
-        num_dependencies_xml = len(root.findall('netgen_params/dependency_variables'))
-        num_frames, percentages = self.get_frames_description_from_xml(name)
-        for num_network in range(num_network_description_xml):
-            network, link = self.get_network_description_from_xml(name, num_network)
+        num_frames = config.get_num_frames()
+        percentages = config.get_percentages()
+        combinations = []  # List with the parameters of all the networks to create
+        for num_network in range(config.get_number_networks()):
+            network, link = config.get_network_description(num_network)
             for num_frame in num_frames:
-                for num_percentage in range(len(percentages[0])):
-                    for num_variables in range(num_variables_xml):
-                        for num_dependencies in range(num_dependencies_xml):
-                            collision_domains = self.get_collision_domains_xml(name, num_network)
-                            periods, per_periods, deadlines, sizes = self.get_frames_variables_from_xml(name,
-                                                                                                        num_variables)
+                for num_percentage in range(config.get_number_percentages()):
+                    for num_variables in range(config.get_number_frame_variables()):
+                        for num_dependencies in range(config.get_number_dependency_variables()):
+                            collision_domains = config.get_collision_domains(num_network)
+                            periods, per_periods, deadlines, sizes = config.get_frame_variables(num_variables)
                             num_dep, max_succ, max_dep, min_time_waiting, max_time_waiting, min_time_deadline, \
                                 max_time_deadline, per_waiting, per_deadline, per_both = \
-                                self.get_dependencies_variables_from_xml(name, num_dependencies)
-                            self.create_network(network, link)
-                            self.generate_paths()
-                            self.define_collision_domains(collision_domains)
-                            self.generate_frames(num_frame, percentages[0][num_percentage],
-                                                 percentages[1][num_percentage], percentages[3][num_percentage],
-                                                 percentages[2][num_percentage])
-                            self.add_frame_params(periods, per_periods, deadlines, sizes)
-                            self.generate_dependencies(num_dep, max_succ, max_dep, min_time_waiting, max_time_waiting,
-                                                       min_time_deadline, max_time_deadline, per_waiting, per_deadline,
-                                                       per_both)
+                                config.get_dependency_variables(num_dependencies)
                             string_for_hash = "net-" + network + "&link-" + link + "&frame-" + str(num_frame) + "&per-"
                             string_for_hash += str(percentages[0][num_percentage]) + ","
                             string_for_hash += str(percentages[1][num_percentage]) + ","
@@ -987,6 +1499,24 @@ class Network:
                             string_for_hash += "&per_deadline" + str(per_deadline) + "&per_both-" + str(per_both)
                             print(string_for_hash)
                             hash_num = self.__autohash(string_for_hash)
-                            os.makedirs("networks/" + str(hash_num))
-                            os.makedirs("networks/" + str(hash_num) + "/schedules")
-                            self.generate_xml_output("networks/" + str(hash_num) + "/" + str(hash_num))
+                            # The seed depends on the parameters, so any network can be created again alone
+                            combination_seed = string_for_hash if seed is None else str(seed) + "&" + string_for_hash
+                            combinations.append((network, link, collision_domains, num_frame,
+                                                 (percentages[0][num_percentage], percentages[1][num_percentage],
+                                                  percentages[3][num_percentage], percentages[2][num_percentage]),
+                                                 (periods, per_periods, deadlines, sizes),
+                                                 config.get_dependency_variables(num_dependencies), str(hash_num),
+                                                 combination_seed))
+
+        if workers == 1:  # Create all the networks in this process
+            try:
+                for combination in combinations:
+                    self.generate_combination(*combination)
+            finally:
+                Network.__topology_cache.clear()  # Do not keep the last topology (and its paths) after the sweep
+        else:  # Every combination is created in one of the processes of the pool
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self.generate_combination, *combination) for combination in combinations]
+                for future in futures:
+                    future.result()  # Raise the exceptions of the workers
@@ -30,7 +30,7 @@ class Node:
 
     # Variable definitions #
 
-    __node_type = 0                           # Type of the node (switch or end system)
+    __slots__ = ('__node_type',)              # Type of the node (switch or end system)
 
     # Standard function definitions #
 
@@ -44,6 +44,18 @@ class Node:
             raise TypeError("The node_type should be a NodeType enumerate")
         self.__node_type = node_type
 
+    @classmethod
+    def _from_trusted(cls, node_type):
+        """
+        Creates a node without checking the value, only for values that are already known to be correct (as the ones
+        saved in a topology)
+        :param node_type: Enumerate value of the node type (end system or switch)
+        :return: node object
+        """
+        node = cls.__new__(cls)
+        node.__node_type = node_type
+        return node
+
     def __str__(self):
         """
         String call of the node class
@@ -0,0 +1,143 @@
+"""* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
+ *                                                                                                                     *
+ *  Path Class                                                                                                         *
+ *  Network Generator                                                                                                  *
+ *                                                                                                                     *
+ *  Created by Francisco Pozo on 30/08/16.                                                                             *
+ *  Copyright © 2016 Francisco Pozo. All rights reserved.                                                              *
+ *                                                                                                                     *
+ *  Class for the paths between end systems. A path does not save its links, it is a small handle with the sender, the *
+ *  receiver and their distances to the lowest common ancestor, and the links are read from the parent chains of the   *
+ *  path engine, that are shared by all the paths of the network. It behaves as a read only list of link INDEXES, the  *
+ *  links are only expanded when they are needed, and the last link is found in O(1).                                  *
+ *                                                                                                                     *
+ * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * """
+
+
+class Path:
+    """
+    Class that has the information to expand the path between two nodes of the network
+    """
+
+    # Variable definitions #
+
+    __slots__ = ('__path_engine',               # Path engine with the parent chains of the network
+                 '__sender',                    # Sender node of the path
+                 '__receiver',                  # Receiver node of the path
+                 '__up_length',                 # Number of links from the sender up to the common ancestor
+                 '__down_length')               # Number of links from the common ancestor down to the receiver
+
+    # Standard function definitions #
+
+    def __init__(self, path_engine, sender, receiver, up_length, down_length):
+        """
+        Initialization of the path
+        :param path_engine: path engine of the network
+        :param sender: sender node id
+        :param receiver: receiver node id
+        :param up_length: number of links from the sender up to the common ancestor
+        :param down_length: number of links from the common ancestor down to the receiver
+        """
+        self.__path_engine = path_engine
+        self.__sender = sender
+        self.__receiver = receiver
+        self.__up_length = up_length
+        self.__down_length = down_length
+
+    def __str__(self):
+        """
+        String call of the path class
+        :return: a string with the information
+        """
+        return "Path from " + str(self.__sender) + " to " + str(self.__receiver) + " : " + str(self.get_links())
+
+    def __len__(self):
+        """
+        Gets the number of links of the path without expanding it
+        :return: number of links
+        """
+        return self.__up_length + self.__down_length
+
+    def __iter__(self):
+        """
+        Iterates over the links of the path from the sender to the receiver
+        :return: iterator of link indexes
+        """
+        node = self.__sender
+        for _ in range(self.__up_length):
+            yield self.__path_engine.get_up_link(node)
+            node = self.__path_engine.get_parent(node)
+        for link in self.__get_down_links():
+            yield link
+
+    def __getitem__(self, index):
+        """
+        Gets a link of the path, the links next to the sender or receiver are found climbing only from that side
+        :param index: position of the link in the path (negative positions start from the receiver)
+        :return: link index
+        """
+        if type(index) == slice:
+            return self.get_links()[index]
+        length = len(self)
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError("The path index is out of range")
+
+        if index < self.__up_length:  # The link is in the way up, climb from the sender
+            node = self.__sender
+            for _ in range(index):
+                node = self.__path_engine.get_parent(node)
+            return self.__path_engine.get_up_link(node)
+        node = self.__receiver  # The link is in the way down, climb from the receiver
+        for _ in range(length - 1 - index):
+            node = self.__path_engine.get_parent(node)
+        return self.__path_engine.get_down_link(node)
+
+    def __eq__(self, other):
+        """
+        Compares the links of the path with other path or list of links
+        :param other: path or list of link indexes
+        :return: True if they have the same links
+        """
+        if isinstance(other, Path) or type(other) == list:
+            return len(self) == len(other) and self.get_links() == list(other)
+        return NotImplemented
+
+    # Private function definitions #
+
+    def __get_down_links(self):
+        """
+        Gets the links from the common ancestor down to the receiver
+        :return: list of link indexes
+        """
+        down_links = []
+        node = self.__receiver
+        for _ in range(self.__down_length):
+            down_links.append(self.__path_engine.get_down_link(node))
+            node = self.__path_engine.get_parent(node)
+        down_links.reverse()
+        return down_links
+
+    # Public function definitions #
+
+    def get_sender(self):
+        """
+        Gets the sender of the path
+        :return: sender node id
+        """
+        return self.__sender
+
+    def get_receiver(self):
+        """
+        Gets the receiver of the path
+        :return: receiver node id
+        """
+        return self.__receiver
+
+    def get_links(self):
+        """
+        Expands the path into a list of links
+        :return: list of link indexes
+        """
+        return list(self)
@@ -0,0 +1,168 @@
+"""* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
+ *                                                                                                                     *
+ *  Path Engine Class                                                                                                  *
+ *  Network Generator                                                                                                  *
+ *                                                                                                                     *
+ *  Created by Francisco Pozo on 30/08/16.                                                                             *
+ *  Copyright © 2016 Francisco Pozo. All rights reserved.                                                              *
+ *                                                                                                                     *
+ *  Class to calculate the paths between the nodes of the network. As the networks created by the description language *
+ *  have no cycles (they are trees), there is only one path between two nodes and it always goes through the lowest    *
+ *  common ancestor of both. The engine keeps the parent and the depth of every node and the indexes of the links      *
+ *  that go up and down to its parent, so a path is found in O(depth) without any search in the graph.                 *
+ *  These parent chains are shared by all the paths, so a path can also be given as a small handle that is only        *
+ *  expanded into links when it is needed.                                                                             *
+ *                                                                                                                     *
+ * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * """
+
+from DENetwork.Path import *
+
+
+class PathEngine:
+    """
+    Class that keeps the tree structure of the network and calculates the paths between nodes
+    """
+
+    # Variable definitions #
+
+    __parents = []                              # Parent of every node (None for the root)
+    __depths = []                               # Depth of every node (0 for the root)
+    __up_links = []                             # Index of the link from every node to its parent
+    __down_links = []                           # Index of the link from the parent to every node
+
+    # Standard function definitions #
+
+    def __init__(self):
+        """
+        Initialization of an empty path engine
+        """
+        self.__parents = []
+        self.__depths = []
+        self.__up_links = []
+        self.__down_links = []
+
+    def __str__(self):
+        """
+        String call of the path engine class
+        :return: a string with the information
+        """
+        return "Path engine with " + str(len(self.__parents)) + " nodes"
+
+    # Public function definitions #
+
+    def add_root(self, node):
+        """
+        Adds the root node of the tree
+        :param node: id of the root node, it must be the next free id
+        :return: None
+        """
+        if node != len(self.__parents):
+            raise ValueError("The nodes should be added in the same order they are created")
+        self.__parents.append(None)
+        self.__depths.append(0)
+        self.__up_links.append(None)
+        self.__down_links.append(None)
+
+    def add_node(self, node, parent, up_link, down_link):
+        """
+        Adds a new node into the tree as child of an already added node
+        :param node: id of the new node, it must be the next free id
+        :param parent: id of the parent node
+        :param up_link: index of the link from the node to its parent
+        :param down_link: index of the link from the parent to the node
+        :return: None
+        """
+        if node != len(self.__parents):
+            raise ValueError("The nodes should be added in the same order they are created")
+        if parent < 0 or parent >= node:
+            raise ValueError("The parent node should be already in the tree")
+        self.__parents.append(parent)
+        self.__depths.append(self.__depths[parent] + 1)
+        self.__up_links.append(up_link)
+        self.__down_links.append(down_link)
+
+    def get_parent(self, node):
+        """
+        Gets the parent of a node
+        :param node: id of the node
+        :return: id of the parent node, None if it is the root
+        """
+        return self.__parents[node]
+
+    def get_depth(self, node):
+        """
+        Gets the depth of a node
+        :param node: id of the node
+        :return: depth of the node
+        """
+        return self.__depths[node]
+
+    def get_up_link(self, node):
+        """
+        Gets the link from a node to its parent
+        :param node: id of the node
+        :return: index of the link, None if it is the root
+        """
+        return self.__up_links[node]
+
+    def get_down_link(self, node):
+        """
+        Gets the link from the parent of a node to the node
+        :param node: id of the node
+        :return: index of the link, None if it is the root
+        """
+        return self.__down_links[node]
+
+    def get_lowest_common_ancestor(self, node_a, node_b):
+        """
+        Finds the lowest common ancestor of two nodes climbing from the deepest one
+        :param node_a: id of the first node
+        :param node_b: id of the second node
+        :return: id of the lowest common ancestor
+        """
+        parents = self.__parents
+        depths = self.__depths
+        while depths[node_a] > depths[node_b]:
+            node_a = parents[node_a]
+        while depths[node_b] > depths[node_a]:
+            node_b = parents[node_b]
+        while node_a != node_b:
+            node_a = parents[node_a]
+            node_b = parents[node_b]
+        return node_a
+
+    def get_path(self, sender, receiver):
+        """
+        Gets the path between two nodes going through their lowest common ancestor
+        :param sender: id of the sender node
+        :param receiver: id of the receiver node
+        :return: list of INDEXES of the links of the path, empty if sender = receiver
+        """
+        parents = self.__parents
+        depths = self.__depths
+        up_path = []  # Links from the sender up to the common ancestor
+        down_path = []  # Links from the receiver up to the common ancestor (reversed later)
+        while depths[sender] > depths[receiver]:
+            up_path.append(self.__up_links[sender])
+            sender = parents[sender]
+        while depths[receiver] > depths[sender]:
+            down_path.append(self.__down_links[receiver])
+            receiver = parents[receiver]
+        while sender != receiver:  # Both climb at the same time until they meet
+            up_path.append(self.__up_links[sender])
+            sender = parents[sender]
+            down_path.append(self.__down_links[receiver])
+            receiver = parents[receiver]
+        down_path.reverse()
+        return up_path + down_path
+
+    def get_path_handle(self, sender, receiver):
+        """
+        Gets the path between two nodes as a handle that reads the links from the parent chains when needed
+        :param sender: id of the sender node
+        :param receiver: id of the receiver node
+        :return: path object
+        """
+        ancestor = self.get_lowest_common_ancestor(sender, receiver)
+        return Path(self, sender, receiver, self.__depths[sender] - self.__depths[ancestor],
+                    self.__depths[receiver] - self.__depths[ancestor])
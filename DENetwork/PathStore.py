@@ -0,0 +1,161 @@
+"""* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
+ *                                                                                                                     *
+ *  Path Store Class                                                                                                   *
+ *  Network Generator                                                                                                  *
+ *                                                                                                                     *
+ *  Created by Francisco Pozo on 30/08/16.                                                                             *
+ *  Copyright © 2016 Francisco Pozo. All rights reserved.                                                              *
+ *                                                                                                                     *
+ *  Class to store the paths between end systems. Only the end system pairs are indexed and the paths are handles     *
+ *  that share the parent chains of the path engine. Making a handle costs the same as finding the lowest common       *
+ *  ancestor, so by default they are not kept and a new one is made every time a path is accessed. The handles can    *
+ *  also be kept in a bounded cache (least recently used ones are dropped) or all of them can be built at once.        *
+ *  It keeps the same [sender][receiver] interface of the old path matrix.                                             *
+ *                                                                                                                     *
+ * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * """
+
+from collections import OrderedDict
+
+
+class PathRow:
+    """
+    Class to access the paths of a single sender with the [receiver] operator
+    """
+
+    # Variable definitions #
+
+    __slots__ = ('__store',                     # Path store that has the paths
+                 '__sender')                    # End system sender of the row
+
+    # Standard function definitions #
+
+    def __init__(self, store, sender):
+        """
+        Initialization of the row of the sender
+        :param store: path store object
+        :param sender: end system sender id
+        """
+        self.__store = store
+        self.__sender = sender
+
+    def __getitem__(self, receiver):
+        """
+        Gets the path from the sender of the row to the receiver
+        :param receiver: end system receiver id
+        :return: path object that behaves as a list of INDEXES of the links of the path
+        """
+        return self.__store.get_path(self.__sender, receiver)
+
+
+class PathStore:
+    """
+    Class that stores the paths between all the end systems of the network, building them on demand
+    """
+
+    # Variable definitions #
+
+    __path_engine = None                        # Path engine to build the paths
+    __end_systems = set()                       # Set with the end systems that can be indexed
+    __cache_size = None                         # Max number of paths kept (None => none kept unless all are built)
+    __paths = None                              # Dictionary with the sender as key and a dictionary with the
+    # receiver as key and the path as value if all are built, ordered dictionary with (sender, receiver) as key if
+    # there is a limit, None if no path is kept
+
+    # Standard function definitions #
+
+    def __init__(self, path_engine, end_systems, cache_size=None, eager=False):
+        """
+        Initialization of the path store
+        :param path_engine: path engine object of the network
+        :param end_systems: list with all the end systems in the network
+        :param cache_size: max number of built paths kept in memory, None to not keep them (a new handle is made every
+        time, in O(depth) as the lowest common ancestor)
+        :param eager: True to build and keep all the paths now, only if the cache size has no limit
+        """
+        # Check if the types and values are correct
+        if cache_size is not None:
+            if type(cache_size) != int:
+                raise TypeError("The cache size must be an integer")
+            if cache_size < 0:
+                raise ValueError("The cache size must be a positive integer")
+            if eager:
+                raise ValueError("All paths can only be built if the cache size has no limit")
+
+        self.__path_engine = path_engine
+        self.__end_systems = set(end_systems)
+        self.__cache_size = cache_size
+        if cache_size is None:  # Nothing to keep until all the paths are built
+            self.__paths = None
+        else:
+            self.__paths = OrderedDict()
+        if eager:
+            self.build_all()
+
+    def __str__(self):
+        """
+        String call of the path store class
+        :return: a string with the information
+        """
+        return "Path store with " + str(len(self)) + " paths built of " + str(len(self.__end_systems)) + \
+               " end systems"
+
+    def __getitem__(self, sender):
+        """
+        Gets the row of paths of a sender, to be used as store[sender][receiver]
+        :param sender: end system sender id
+        :return: row with the paths of the sender
+        """
+        if sender not in self.__end_systems:
+            raise ValueError("The sender " + str(sender) + " is not an end system")
+        return PathRow(self, sender)
+
+    def __len__(self):
+        """
+        Gets the number of paths that are built
+        :return: number of built paths
+        """
+        if self.__paths is None:
+            return 0
+        if self.__cache_size is None:
+            return sum(len(row) for row in self.__paths.values())
+        return len(self.__paths)
+
+    # Public function definitions #
+
+    def get_path(self, sender, receiver):
+        """
+        Gets the path between two end systems, a new handle is made if it is not in the store
+        :param sender: end system sender id
+        :param receiver: end system receiver id
+        :return: path object that behaves as a list of INDEXES of the links of the path, empty if sender = receiver
+        """
+        if self.__cache_size is None:
+            if self.__paths is not None:  # All the paths are built
+                row = self.__paths.get(sender)
+                if row is not None and receiver in row:
+                    return row[receiver]
+        else:
+            key = (sender, receiver)
+            if key in self.__paths:
+                self.__paths.move_to_end(key)  # Mark it as the most recently used
+                return self.__paths[key]
+
+        if receiver not in self.__end_systems or sender not in self.__end_systems:
+            raise ValueError("Paths are only stored between end systems")
+        path = self.__path_engine.get_path_handle(sender, receiver)
+        if self.__cache_size is not None and self.__cache_size > 0:
+            if len(self.__paths) >= self.__cache_size:  # Drop the least recently used path
+                self.__paths.popitem(last=False)
+            self.__paths[key] = path
+        return path
+
+    def build_all(self):
+        """
+        Builds the paths between all the end systems at once
+        :return: None
+        """
+        if self.__cache_size is not None:
+            raise ValueError("All paths can only be built if the cache size has no limit")
+        get_path_handle = self.__path_engine.get_path_handle
+        self.__paths = {sender: {receiver: get_path_handle(sender, receiver) for receiver in self.__end_systems
+                                 if receiver != sender} for sender in self.__end_systems}
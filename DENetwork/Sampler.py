@@ -0,0 +1,98 @@
+"""* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
+ *                                                                                                                     *
+ *  Sampler Class                                                                                                      *
+ *  Network Generator                                                                                                  *
+ *                                                                                                                     *
+ *  Created by Francisco Pozo on 30/08/16.                                                                             *
+ *  Copyright © 2016 Francisco Pozo. All rights reserved.                                                              *
+ *                                                                                                                     *
+ *  Class to choose random categories (as the frame types or the periods) with a given percentage for every category.  *
+ *  The normalized percentages are accumulated once in an array, and every choice is a binary search of a random      *
+ *  number in it. The accumulated values are the same as the ones of walking the percentages adding them, so the       *
+ *  choices are the same. If the rounding of the accumulated values leaves a random number out of all of them, the     *
+ *  last category with a percentage greater than 0 is chosen.                                                          *
+ *                                                                                                                     *
+ * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * """
+
+from bisect import bisect_right
+
+
+class Sampler:
+    """
+    Class that chooses random categories with the given percentages
+    """
+
+    # Variable definitions #
+
+    __probabilities = []                        # Normalized percentage of every category
+    __cumulative = []                           # Sum of the percentages up to every category (included)
+    __last = 0                                  # Last category with a percentage greater than 0
+
+    # Standard function definitions #
+
+    def __init__(self, percentages):
+        """
+        Initialization of the sampler, the percentages are normalized so their sum is 1.0
+        :param percentages: list with the percentage of every category
+        """
+        # Check if the types and values are correct
+        if type(percentages) != list or len(percentages) == 0:
+            raise TypeError("The percentages must be a list of reals")
+        if not all(type(percentage) == int or type(percentage) == float for percentage in percentages):
+            raise TypeError("All percentages must be real numbers")
+        if not all(percentage >= 0 for percentage in percentages):
+            raise ValueError("All percentages must be greater or equal to 0")
+        total = sum(percentages)
+        if total == 0:
+            raise ValueError("At least one percentage should be greater than 0")
+
+        self.__probabilities = [float(percentage) / total for percentage in percentages]
+        self.__cumulative = []
+        accumulate = 0
+        for category, probability in enumerate(self.__probabilities):
+            accumulate += probability
+            self.__cumulative.append(accumulate)
+            if probability > 0:
+                self.__last = category
+
+    def __str__(self):
+        """
+        String call of the sampler class
+        :return: a string with the information
+        """
+        return "Sampler with probabilities " + str(self.__probabilities)
+
+    def __len__(self):
+        """
+        Gets the number of categories
+        :return: number of categories
+        """
+        return len(self.__probabilities)
+
+    # Public function definitions #
+
+    def get_probabilities(self):
+        """
+        Gets the normalized percentages
+        :return: new list with the probability of every category
+        """
+        return list(self.__probabilities)
+
+    def choose(self, generator):
+        """
+        Chooses a random category
+        :param generator: random generator
+        :return: index of the category
+        """
+        return min(bisect_right(self.__cumulative, generator.random()), self.__last)
+
+    def choose_many(self, generator, number):
+        """
+        Chooses many random categories at once, with one random number for every one in order
+        :param generator: random generator
+        :param number: number of categories to choose
+        :return: list with the index of every category chosen
+        """
+        cumulative = self.__cumulative
+        last = self.__last
+        return [min(bisect_right(cumulative, generator.random()), last) for _ in range(number)]
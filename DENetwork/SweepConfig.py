@@ -0,0 +1,306 @@
+"""* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
+ *                                                                                                                     *
+ *  Sweep Config Class                                                                                                 *
+ *  Network Generator                                                                                                  *
+ *                                                                                                                     *
+ *  Created by Francisco Pozo on 30/08/16.                                                                             *
+ *  Copyright © 2016 Francisco Pozo. All rights reserved.                                                              *
+ *                                                                                                                     *
+ *  Class with all the parameters of the netgen_params xml file, used to create all the combinations of networks.      *
+ *  The file is read only once and all the values are saved in tuples that cannot be modified. The getters return new  *
+ *  lists, so the functions of the network can change them without modifying the configuration.                        *
+ *                                                                                                                     *
+ * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * """
+
+
+class SweepConfig:
+    """
+    Class that has all the parameters read from the xml file to create networks
+    """
+
+    # Variable definitions #
+
+    __network_descriptions = ()                 # Tuple with the network and link descriptions of every network
+    __collision_domains = ()                    # Tuple with the collision domains matrix of every network
+    __num_frames = ()                           # Tuple with the different number of frames
+    __percentages = ()                          # Tuple with the percentages of broadcast, single, multi and locally
+    __frame_variables = ()                      # Tuple with the periods, percentages, deadlines and sizes
+    __dependency_variables = ()                 # Tuple with the parameters of the dependencies
+
+    # Standard function definitions #
+
+    def __init__(self, name):
+        """
+        Initialization of the configuration, reads the xml file once
+        :param name: name of the xml file
+        """
+        import xml.etree.ElementTree as Xml  # Imported when needed, to start faster in the worker processes
+
+        try:  # Try to open the file
+            tree = Xml.parse(name)
+        except:
+            raise Exception("Could not read the xml file")
+        root = tree.getroot()
+
+        self.__network_descriptions = tuple(self.read_network_description(network_description_xml) for
+                                            network_description_xml in
+                                            root.findall('netgen_params/network_description'))
+        self.__collision_domains = tuple(tuple(tuple(collision_domain) for collision_domain in
+                                               self.read_collision_domains(collision_domains_xml)) for
+                                         collision_domains_xml in root.findall('netgen_params/collision_domains'))
+        if len(self.__collision_domains) != len(self.__network_descriptions):
+            raise Exception('Every network description should have its collision domain')
+
+        num_frames, percentages = self.read_frames_description(root.find('netgen_params/frame_types'))
+        self.__num_frames = tuple(num_frames)
+        self.__percentages = tuple(tuple(percentage) for percentage in percentages)
+
+        frame_variables = []
+        for variables_xml in root.findall('netgen_params/frame_variables'):
+            frame_variables.append(tuple(None if variable is None else tuple(variable) for variable in
+                                         self.read_frame_variables(variables_xml)))
+        self.__frame_variables = tuple(frame_variables)
+        self.__dependency_variables = tuple(self.read_dependency_variables(variables_xml) for variables_xml in
+                                            root.findall('netgen_params/dependency_variables'))
+
+    def __str__(self):
+        """
+        String call of the sweep config class
+        :return: a string with the information
+        """
+        return_text = "Sweep configuration =>\n"
+        return_text += "    Networks            : " + str(len(self.__network_descriptions)) + "\n"
+        return_text += "    Number of frames    : " + str(list(self.__num_frames)) + "\n"
+        return_text += "    Percentages         : " + str(self.get_number_percentages()) + "\n"
+        return_text += "    Frame variables     : " + str(len(self.__frame_variables)) + "\n"
+        return_text += "    Dependency variables: " + str(len(self.__dependency_variables))
+        return return_text
+
+    # Public function definitions #
+
+    @staticmethod
+    def read_network_description(network_description_xml):
+        """
+        Reads the network description (including the link description if exist) from its xml element
+        :param network_description_xml: network_description element
+        :return: network description and link description (formated to work in the network function), the link
+        description is None if it does not exist
+        """
+        network_description_line = ''
+        link_info_line = ''
+        links_found = False
+
+        for difurcation in network_description_xml.findall('difurcation'):  # For all difurcations found
+            network_description_line += difurcation.find('value').text + ';'
+            value = int(difurcation.find('value').text)
+            links_xml = difurcation.find('links')
+            links_counter = 0
+            links_found = False
+            if links_xml is not None:  # See if there is also links description
+                links_found = True
+                for link_xml in links_xml.findall('link'):  # For all links information
+                    links_counter += 1
+
+                    # Save the type information and check if is correct
+                    link_type = link_xml.find('type').text
+                    if link_type == 'wired':
+                        link_info_line += 'w'
+                    elif link_type == 'wireless':
+                        link_info_line += 'x'
+                    else:
+                        raise TypeError('The type of the link is not wired neither wireless')
+
+                    # Save the speed of the link and check if is correct
+                    speed = link_xml.find('speed').text
+                    try:
+                        speed = int(speed)
+                    except ValueError:
+                        raise TypeError('The speed is not an integer')
+                    if speed <= 0:
+                        raise ValueError('The speed should be larger than 0')
+                    link_info_line += str(speed) + ';'
+
+            if abs(value) != links_counter:
+                raise ValueError('The number of links is incorrect, they should be the same as the difurcations')
+
+        if not links_found:
+            return network_description_line[0:-1], None
+        else:
+            return network_description_line[0:-1], link_info_line[0:-1]
+
+    @staticmethod
+    def read_collision_domains(collision_domains_xml):
+        """
+        Reads the matrix of collision domains from its xml element
+        :param collision_domains_xml: collision_domains element
+        :return: the matrix of collision domains
+        """
+        collision_domain = []
+        for collision_domain_xml in collision_domains_xml.findall('collision_domain'):  # For all collision domains
+            links = collision_domain_xml.find('links').text
+            collision_domain.append([int(link) for link in links.split(';')])  # Save into the matrix
+
+        return collision_domain
+
+    @staticmethod
+    def read_frames_description(parameters_xml):
+        """
+        Reads the important parameters to create the frames from the frame_types xml element
+        :param parameters_xml: frame_types element
+        :return: number of frames, percentages of broadcast, single, multi and locally frames
+        """
+        num_frames = []
+        frame_parameters = []
+        first = True
+        for parameter_xml in parameters_xml.findall('param'):  # For all the parameters
+            try:  # Save the parameters and check if the values are correct
+                if first:
+                    first = False
+                    for n in parameter_xml.findall('value'):
+                        num_frames.append(int(n.text))
+                else:
+                    frame_parameters.append([])
+                    for n in parameter_xml.findall('value'):
+                        frame_parameters[-1].append(float(n.text))
+                        if frame_parameters[-1][-1] < 0.0:
+                            raise ValueError('The percentages should be 0 or positive')
+            except:
+                raise TypeError('The types are incorrect')
+            if not all(num_frames) > 0:
+                raise ValueError('The number of frames should be positive')
+
+        return num_frames, frame_parameters
+
+    @staticmethod
+    def read_frame_variables(variables_xml):
+        """
+        Reads the lists of variables for the periods, deadlines and sizes from the frame_variables xml element
+        :param variables_xml: frame_variables element
+        :return: lists of periods, percentage periods, deadlines and sizes
+        """
+        # Init the lists needed to return
+        period = []
+        per_period = []
+        deadline = []
+        size = []
+        deadlines = False
+        sizes = False
+
+        for parameter_xml in variables_xml.findall('variable'):  # For all parameters
+            period.append(int(parameter_xml.find('period').text))  # Save the period
+            per_period.append(float(parameter_xml.find('per_period').text))  # Save the percentage
+            if parameter_xml.find('deadline') is not None:  # Save the deadline if exists
+                deadlines = True
+                deadline.append(float(parameter_xml.find('deadline').text))
+            if parameter_xml.find('deadline') is not None:  # Save the size if exists
+                size.append(int(parameter_xml.find('size').text))
+                sizes = True
+
+        # See what do we have to return
+        if deadlines and sizes:
+            return period, per_period, deadline, size
+        elif deadlines and not sizes:
+            return period, per_period, deadline, None
+        elif not deadlines and sizes:
+            return period, per_period, None, size
+        else:
+            return period, per_period, None, None
+
+    @staticmethod
+    def read_dependency_variables(variables_xml):
+        """
+        Reads the variables for the dependency from the dependency_variables xml element
+        :param variables_xml: dependency_variables element
+        :return: dependency variables
+        """
+        parameter_xml = variables_xml.find('variable')
+        num_dep = int(parameter_xml.find('num_dep').text)
+        max_succ = int(parameter_xml.find('max_succ').text)
+        max_dep = int(parameter_xml.find('max_dep').text)
+        min_time_waiting = int(parameter_xml.find('min_time_waiting').text)
+        max_time_waiting = int(parameter_xml.find('max_time_waiting').text)
+        min_time_deadline = int(parameter_xml.find('min_time_deadline').text)
+        max_time_deadline = int(parameter_xml.find('max_time_deadline').text)
+        per_waiting = float(parameter_xml.find('per_waiting').text)
+        per_deadline = float(parameter_xml.find('per_deadline').text)
+        per_both = float(parameter_xml.find('per_both').text)
+
+        return num_dep, max_succ, max_dep, min_time_waiting, max_time_waiting, min_time_deadline, max_time_deadline, \
+            per_waiting, per_deadline, per_both
+
+    def get_number_networks(self):
+        """
+        Gets the number of network descriptions
+        :return: number of networks
+        """
+        return len(self.__network_descriptions)
+
+    def get_network_description(self, num_network):
+        """
+        Gets the network and link descriptions of a network
+        :param num_network: position of the network in the xml
+        :return: network description and link description (None if it does not exist)
+        """
+        return self.__network_descriptions[num_network]
+
+    def get_collision_domains(self, num_network):
+        """
+        Gets the collision domains of a network
+        :param num_network: position of the network in the xml
+        :return: new matrix of collision domains
+        """
+        return [list(collision_domain) for collision_domain in self.__collision_domains[num_network]]
+
+    def get_num_frames(self):
+        """
+        Gets the different number of frames
+        :return: list with the number of frames
+        """
+        return list(self.__num_frames)
+
+    def get_number_percentages(self):
+        """
+        Gets the number of different percentages of frame types
+        :return: number of percentages
+        """
+        if len(self.__percentages) == 0:
+            return 0
+        return len(self.__percentages[0])
+
+    def get_percentages(self):
+        """
+        Gets the percentages of the frame types
+        :return: matrix with the percentages of broadcast, single, multi and locally frames
+        """
+        return [list(percentage) for percentage in self.__percentages]
+
+    def get_number_frame_variables(self):
+        """
+        Gets the number of different frame variables
+        :return: number of frame variables
+        """
+        return len(self.__frame_variables)
+
+    def get_frame_variables(self, num_variable):
+        """
+        Gets the variables for the periods, deadlines and sizes
+        :param num_variable: position of the variables in the xml
+        :return: lists of periods, percentage periods, deadlines and sizes (None if they do not exist)
+        """
+        return tuple(None if variable is None else list(variable) for variable in
+                     self.__frame_variables[num_variable])
+
+    def get_number_dependency_variables(self):
+        """
+        Gets the number of different dependency variables
+        :return: number of dependency variables
+        """
+        return len(self.__dependency_variables)
+
+    def get_dependency_variables(self, num_variable):
+        """
+        Gets the variables for the dependencies
+        :param num_variable: position of the variables in the xml
+        :return: dependency variables
+        """
+        return self.__dependency_variables[num_variable]
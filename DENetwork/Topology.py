@@ -0,0 +1,249 @@
+"""* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
+ *                                                                                                                     *
+ *  Topology Class                                                                                                     *
+ *  Network Generator                                                                                                  *
+ *                                                                                                                     *
+ *  Created by Francisco Pozo on 30/08/16.                                                                             *
+ *  Copyright © 2016 Francisco Pozo. All rights reserved.                                                              *
+ *                                                                                                                     *
+ *  Class for the nodes and links of the network saved in arrays of numbers instead of node and link objects.          *
+ *  Nodes are numbered in order of creation and every node but the root is created with the two links to its parent,   *
+ *  so the node k + 1 has the link 2k from its parent and the link 2k + 1 to its parent. Then the source, destination  *
+ *  and index of any link are calculated from the parent array without saving them.                                    *
+ *  The children of a node are saved as a linked list in arrays (first child and next sibling of every node).          *
+ *  A NetworkX graph with the node and link objects can be created when it is needed.                                  *
+ *                                                                                                                     *
+ * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * """
+
+from array import array
+from DENetwork.Node import *
+from DENetwork.Link import *
+
+
+class Topology:
+    """
+    Class that has the nodes and links of a tree network
+    """
+
+    # Variable definitions #
+
+    __node_types = None                         # Byte array with the NodeType value of every node
+    __parents = None                            # Array with the parent of every node (-1 for the root)
+    __first_children = None                     # Array with the first child of every node (-1 if it has none)
+    __last_children = None                      # Array with the last child of every node (-1 if it has none)
+    __next_siblings = None                      # Array with the next child of the parent of every node (-1 if last)
+    __link_speeds = None                        # Array with the speed of both links between a node and its parent
+    __link_types = None                         # Byte array with the LinkType value of both links to the parent
+
+    # Standard function definitions #
+
+    def __init__(self):
+        """
+        Initialization of an empty topology
+        """
+        self.__node_types = bytearray()
+        self.__parents = array('l')
+        self.__first_children = array('l')
+        self.__last_children = array('l')
+        self.__next_siblings = array('l')
+        self.__link_speeds = array('l')
+        self.__link_types = bytearray()
+
+    def __str__(self):
+        """
+        String call of the topology class
+        :return: a string with the information
+        """
+        return "Topology with " + str(len(self.__node_types)) + " nodes and " + str(self.get_number_links()) + \
+               " links"
+
+    # Private function definitions #
+
+    def __check_link(self, link):
+        """
+        Checks that the link exists
+        :param link: index of the link
+        :return: None
+        """
+        if type(link) != int:
+            raise TypeError("The link should be an integer")
+        if link < 0 or link >= self.get_number_links():
+            raise ValueError("The link " + str(link) + " does not exist")
+
+    # Public function definitions #
+
+    def add_node(self, node_type, parent=None, speed=100, link_type=LinkType.wired):
+        """
+        Adds a new node into the topology with the two links to its parent
+        :param node_type: Enumerate value of the node type (end system or switch)
+        :param parent: id of the parent node, None for the root
+        :param speed: speed of the links to the parent in MB/s
+        :param link_type: type of the links to the parent (wired or wireless)
+        :return: id of the new node
+        """
+        # Check if the types and values are correct
+        if type(node_type) != NodeType:
+            raise TypeError("The node_type should be a NodeType enumerate")
+        node = len(self.__node_types)
+        if parent is None:
+            if node != 0:
+                raise ValueError("Only the first node can be the root")
+        else:
+            if parent < 0 or parent >= node:
+                raise ValueError("The parent node should be already in the topology")
+            if type(speed) != int:
+                raise TypeError("The speed is not a number")
+            if speed <= 0:
+                raise ValueError("The speed should be a positive integer")
+            if type(link_type) != LinkType:
+                raise TypeError("The link type should be a LinkType enumerate")
+
+        self.__node_types.append(node_type.value)
+        self.__first_children.append(-1)
+        self.__last_children.append(-1)
+        self.__next_siblings.append(-1)
+        if parent is None:
+            self.__parents.append(-1)
+        else:
+            self.__parents.append(parent)
+            if self.__last_children[parent] < 0:
+                self.__first_children[parent] = node
+            else:
+                self.__next_siblings[self.__last_children[parent]] = node
+            self.__last_children[parent] = node
+            self.__link_speeds.append(speed)
+            self.__link_types.append(link_type.value)
+        return node
+
+    def set_node_type(self, node, node_type):
+        """
+        Changes the type of a node
+        :param node: id of the node
+        :param node_type: Enumerate value of the node type (end system or switch)
+        :return: None
+        """
+        if type(node_type) != NodeType:
+            raise TypeError("The node_type should be a NodeType enumerate")
+        self.__node_types[node] = node_type.value
+
+    def get_number_nodes(self):
+        """
+        Gets the number of nodes
+        :return: number of nodes
+        """
+        return len(self.__node_types)
+
+    def get_number_links(self):
+        """
+        Gets the number of links, two for every node but the root
+        :return: number of links
+        """
+        return 2 * len(self.__link_speeds)
+
+    def get_node_type(self, node):
+        """
+        Gets the type of a node
+        :param node: id of the node
+        :return: node type
+        """
+        return NodeType(self.__node_types[node])
+
+    def get_parent(self, node):
+        """
+        Gets the parent of a node
+        :param node: id of the node
+        :return: id of the parent node, None if it is the root
+        """
+        parent = self.__parents[node]
+        return None if parent < 0 else parent
+
+    def get_children(self, node):
+        """
+        Gets the children of a node in order of creation
+        :param node: id of the node
+        :return: list with the id of the children
+        """
+        children = []
+        child = self.__first_children[node]
+        while child >= 0:
+            children.append(child)
+            child = self.__next_siblings[child]
+        return children
+
+    def get_link_index(self, source, destination):
+        """
+        Gets the index of the link that goes from the source node to the destination node
+        :param source: node source
+        :param destination: node destination
+        :return: index of the link
+        """
+        num_nodes = len(self.__node_types)
+        if 0 < destination < num_nodes and self.__parents[destination] == source:  # Down link
+            return 2 * (destination - 1)
+        if 0 < source < num_nodes and self.__parents[source] == destination:  # Up link
+            return 2 * (source - 1) + 1
+        raise ValueError("There is no link from node " + str(source) + " to node " + str(destination))
+
+    def get_link_source(self, link):
+        """
+        Gets the node source of a link
+        :param link: index of the link
+        :return: id of the node source
+        """
+        self.__check_link(link)
+        node = link // 2 + 1
+        return self.__parents[node] if link % 2 == 0 else node
+
+    def get_link_destination(self, link):
+        """
+        Gets the node destination of a link
+        :param link: index of the link
+        :return: id of the node destination
+        """
+        self.__check_link(link)
+        node = link // 2 + 1
+        return node if link % 2 == 0 else self.__parents[node]
+
+    def get_link_speed(self, link):
+        """
+        Gets the speed of a link
+        :param link: index of the link
+        :return: speed in MB/s
+        """
+        self.__check_link(link)
+        return self.__link_speeds[link // 2]
+
+    def get_link_type(self, link):
+        """
+        Gets the type of a link
+        :param link: index of the link
+        :return: link type
+        """
+        self.__check_link(link)
+        return LinkType(self.__link_types[link // 2])
+
+    def get_link(self, link):
+        """
+        Gets a new link object with the information of a link
+        :param link: index of the link
+        :return: link object
+        """
+        return Link._from_trusted(self.get_link_speed(link), self.get_link_type(link))  # Checked when it was added
+
+    def to_networkx(self):
+        """
+        Creates a NetworkX graph with the topology. Every node has its node object as type and its position in the
+        list of switches or end systems as id, and every edge has its link object as type and its number as id
+        :return: NetworkX graph
+        """
+        import networkx as nx  # Only needed for this export, the rest of the package works without it
+
+        graph = nx.Graph()
+        counters = {NodeType.switch: 0, NodeType.end_system: 0}
+        for node in range(len(self.__node_types)):
+            node_type = self.get_node_type(node)
+            graph.add_node(node, type=Node._from_trusted(node_type), id=counters[node_type])
+            counters[node_type] += 1
+        for edge in range(len(self.__link_speeds)):
+            graph.add_edge(self.__parents[edge + 1], edge + 1, type=self.get_link(2 * edge), id=edge)
+        return graph
@@ -0,0 +1,142 @@
+"""* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
+ *                                                                                                                     *
+ *  Xml Writer Class                                                                                                   *
+ *  Network Generator                                                                                                  *
+ *                                                                                                                     *
+ *  Created by Francisco Pozo on 30/08/16.                                                                             *
+ *  Copyright © 2016 Francisco Pozo. All rights reserved.                                                              *
+ *                                                                                                                     *
+ *  Class to write xml files element by element directly into a file, without building the whole document in memory.   *
+ *  Only the names of the open elements are kept. With indentation, the text is the same as the one of the pretty      *
+ *  print of minidom (elements with only text in one line and empty elements closed as <name/>).                       *
+ *                                                                                                                     *
+ * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * """
+
+
+class XmlWriter:
+    """
+    Class that writes an xml document into a file while its elements are added
+    """
+
+    # Variable definitions #
+
+    __file = None                               # File handle where the xml is written
+    __indent = None                             # Text to indent every level (None => no indentation)
+    __open_elements = []                        # Stack with the names of the open elements
+    __pending = False                           # True if the last open element has not closed its start tag yet
+
+    # Standard function definitions #
+
+    def __init__(self, file, indent="   "):
+        """
+        Initialization of the writer, it writes the xml declaration
+        :param file: file handle opened for writing text
+        :param indent: text to indent every level, None to write everything without new lines
+        """
+        # Check if the types and values are correct
+        if indent is not None and type(indent) != str:
+            raise TypeError("The indent must be a string")
+
+        self.__file = file
+        self.__indent = indent
+        self.__open_elements = []
+        self.__pending = False
+        self.__file.write('<?xml version="1.0" ?>')
+        self.__new_line()
+
+    def __str__(self):
+        """
+        String call of the xml writer class
+        :return: a string with the information
+        """
+        return "Xml writer with " + str(len(self.__open_elements)) + " open elements"
+
+    # Private function definitions #
+
+    @staticmethod
+    def __escape(text):
+        """
+        Escapes the characters that cannot be in the text of an element (the same as xml.sax.saxutils.escape, which
+        takes long to import)
+        :param text: text of the element
+        :return: escaped text
+        """
+        return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+    def __new_line(self):
+        """
+        Writes a new line if there is indentation
+        :return: None
+        """
+        if self.__indent is not None:
+            self.__file.write("\n")
+
+    def __write_indent(self):
+        """
+        Writes the indentation of the actual level
+        :return: None
+        """
+        if self.__indent is not None:
+            self.__file.write(self.__indent * len(self.__open_elements))
+
+    def __close_pending(self):
+        """
+        Closes the start tag of the last open element, as it will have children
+        :return: None
+        """
+        if self.__pending:
+            self.__file.write(">")
+            self.__new_line()
+            self.__pending = False
+
+    # Public function definitions #
+
+    def start(self, name):
+        """
+        Opens a new element as child of the last open element
+        :param name: name of the element
+        :return: None
+        """
+        self.__close_pending()
+        self.__write_indent()
+        self.__file.write("<" + name)
+        self.__open_elements.append(name)
+        self.__pending = True
+
+    def end(self):
+        """
+        Closes the last open element
+        :return: None
+        """
+        name = self.__open_elements.pop()
+        if self.__pending:  # The element has no children
+            self.__file.write("/>")
+            self.__pending = False
+        else:
+            self.__write_indent()
+            self.__file.write("</" + name + ">")
+        self.__new_line()
+
+    def element(self, name, text):
+        """
+        Writes an element that only has text as child of the last open element
+        :param name: name of the element
+        :param text: text of the element
+        :return: None
+        """
+        self.__close_pending()
+        self.__write_indent()
+        text = str(text)
+        if text == '':
+            self.__file.write("<" + name + "/>")
+        else:
+            self.__file.write("<" + name + ">" + self.__escape(text) + "</" + name + ">")
+        self.__new_line()
+
+    def close(self):
+        """
+        Closes all the elements that are still open
+        :return: None
+        """
+        while len(self.__open_elements) > 0:
+            self.end()
@@ -0,0 +1,79 @@
+"""* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
+ *                                                                                                                     *
+ *  Import Time Test                                                                                                   *
+ *  Network Generator                                                                                                  *
+ *                                                                                                                     *
+ *  Created by Francisco Pozo on 30/08/16.                                                                             *
+ *  Copyright © 2016 Francisco Pozo. All rights reserved.                                                              *
+ *                                                                                                                     *
+ *  Test that importing the network module stays fast. The sweep creates the networks in many short-lived processes    *
+ *  that import the package, so the heavy modules (networkx, ElementTree, the process pool and shutil) must only be    *
+ *  imported by the functions that use them. The import is measured with python -X importtime in a new process.       *
+ *                                                                                                                     *
+ * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * """
+
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # Directory with the DENetwork package
+BUDGET = 150000  # Max time in microseconds to import DENetwork.Network (networkx alone takes hundreds of ms)
+LAZY_MODULES = ['networkx', 'xml.etree', 'concurrent.futures', 'shutil']  # Modules that must not be imported
+
+
+class ImportTimeTest(unittest.TestCase):
+    """
+    Class with the tests of the import of the network module
+    """
+
+    # Private function definitions #
+
+    @staticmethod
+    def __run(arguments):
+        """
+        Runs python in a new process from the root of the repository
+        :param arguments: list with the arguments of python
+        :return: completed process with the standard output and error as text
+        """
+        return subprocess.run([sys.executable] + arguments, cwd=ROOT, capture_output=True, text=True, check=True)
+
+    def __import_time(self):
+        """
+        Measures the time to import DENetwork.Network, the sum of the cumulative time of the top level DENetwork
+        modules in the python -X importtime report
+        :return: time in microseconds
+        """
+        total = 0
+        report = self.__run(['-X', 'importtime', '-c', 'import DENetwork.Network']).stderr
+        for line in report.splitlines():
+            if not line.startswith('import time:') or line.count('|') != 2:
+                continue
+            _, cumulative, name = line.split('|')
+            if name.startswith(' DENetwork') and cumulative.strip().isdigit():  # Top level, not indented
+                total += int(cumulative)
+        return total
+
+    # Public function definitions #
+
+    def test_import_time(self):
+        """
+        Checks that the import is below the budget (best of three runs, after a first run that writes the bytecode)
+        """
+        self.__run(['-c', 'import DENetwork.Network'])
+        import_time = min(self.__import_time() for _ in range(3))
+        self.assertGreater(import_time, 0)
+        self.assertLess(import_time, BUDGET, "Importing DENetwork.Network took " + str(import_time) + " us")
+
+    def test_lazy_modules(self):
+        """
+        Checks that the heavy modules are not imported with the network module
+        """
+        code = "import sys, DENetwork.Network; print(';'.join(sorted(sys.modules)))"
+        modules = set(self.__run(['-c', code]).stdout.strip().split(';'))
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, modules, module + " is imported with DENetwork.Network")
+
+
+if __name__ == '__main__':
+    unittest.main()
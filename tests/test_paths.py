@@ -0,0 +1,177 @@
+"""* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
+ *                                                                                                                     *
+ *  Paths Test                                                                                                         *
+ *  Network Generator                                                                                                  *
+ *                                                                                                                     *
+ *  Created by Francisco Pozo on 30/08/16.                                                                             *
+ *  Copyright © 2016 Francisco Pozo. All rights reserved.                                                              *
+ *                                                                                                                     *
+ *  Test of the paths between end systems. The paths of the path store are compared with the shortest paths found     *
+ *  with a breadth first search in the topology of random networks, the same paths of the old path matrix. It also     *
+ *  checks that the paths of a network with 5000 end systems are found in a time budget. Run as a script to print     *
+ *  the time of the benchmark.                                                                                         *
+ *                                                                                                                     *
+ * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * """
+
+import os
+import sys
+import time
+import unittest
+from random import Random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Directory with the package
+from DENetwork.Network import *
+
+NUMBER_TREES = 30  # Number of random networks compared with the breadth first search
+LARGE_NETWORK = "50;" + ";".join(["-100"] * 50)  # Network with 5000 end systems, 50 switches with 100 each
+NUMBER_SENDERS = 100  # Number of senders of the large network whose paths to all the end systems are expanded
+BUDGET = 60.0  # Max time in seconds to expand the paths of the large network
+
+
+def get_end_systems(topology):
+    """
+    Gets the end systems of a topology
+    :param topology: topology of the network
+    :return: list with the end systems id
+    """
+    return [node for node in range(topology.get_number_nodes()) if topology.get_node_type(node) == NodeType.end_system]
+
+
+def expand_paths(network, senders):
+    """
+    Expands the paths from the senders to all the end systems
+    :param network: network object
+    :param senders: list with the senders
+    :return: number of paths expanded
+    """
+    end_systems = get_end_systems(network.get_topology())
+    paths = network.get_paths()
+    number_paths = 0
+    for sender in senders:
+        row = paths[sender]
+        for receiver in end_systems:
+            if receiver != sender:
+                list(row[receiver])
+                number_paths += 1
+    return number_paths
+
+
+def benchmark():
+    """
+    Prints the time to create networks of 1000, 2000 and 5000 end systems and expand the paths of some senders
+    :return: None
+    """
+    for switches in (10, 20, 50):
+        network = Network()
+        start = time.perf_counter()
+        network.create_network(str(switches) + ";" + ";".join(["-100"] * switches))
+        network.generate_paths()
+        end_systems = get_end_systems(network.get_topology())
+        number_paths = expand_paths(network, Random(1).sample(end_systems, NUMBER_SENDERS))
+        elapsed = time.perf_counter() - start
+        print(str(len(end_systems)) + " end systems: " + str(number_paths) + " paths in %.2f s (%.2f us per path)"
+              % (elapsed, elapsed * 1e6 / number_paths))
+
+
+class PathsTest(unittest.TestCase):
+    """
+    Class with the tests of the paths between end systems
+    """
+
+    # Private function definitions #
+
+    @staticmethod
+    def __random_description(generator, depth=0):
+        """
+        Creates the description of a random branch of a network
+        :param generator: random generator
+        :param depth: depth of the branch
+        :return: list with the elements of the description
+        """
+        value = generator.random()
+        if depth > 0 and value < 0.1:  # The switch is an end system
+            return [0]
+        if depth >= 4 or value < 0.4:  # The switch has only end systems
+            return [-generator.randint(1, 4)]
+        branches = generator.randint(1, 3)
+        description = [branches]
+        for _ in range(branches):
+            description += PathsTest.__random_description(generator, depth + 1)
+        return description
+
+    @staticmethod
+    def __search_path(topology, sender, receiver):
+        """
+        Finds the shortest path between two nodes with a breadth first search, as the old path matrix
+        :param topology: topology of the network
+        :param sender: id of the sender node
+        :param receiver: id of the receiver node
+        :return: list of INDEXES of the links of the path
+        """
+        previous = {sender: None}
+        level = [sender]
+        while receiver not in previous:
+            next_level = []
+            for node in level:
+                neighbours = topology.get_children(node)
+                if topology.get_parent(node) is not None:
+                    neighbours.append(topology.get_parent(node))
+                for neighbour in neighbours:
+                    if neighbour not in previous:
+                        previous[neighbour] = node
+                        next_level.append(neighbour)
+            level = next_level
+        path = []
+        node = receiver
+        while previous[node] is not None:
+            path.append(topology.get_link_index(previous[node], node))
+            node = previous[node]
+        path.reverse()
+        return path
+
+    # Public function definitions #
+
+    def test_random_trees(self):
+        """
+        Checks that the paths of the store (lazy, bounded and eager) are the shortest paths of random networks
+        """
+        generator = Random(1)
+        for _ in range(NUMBER_TREES):
+            description = ";".join(str(value) for value in self.__random_description(generator))
+            network = Network()
+            network.create_network(description)
+            topology = network.get_topology()
+            end_systems = get_end_systems(topology)
+            for cache_size, eager in ((None, False), (3, False), (None, True)):
+                network.generate_paths(cache_size, eager)
+                paths = network.get_paths()
+                for sender in end_systems:
+                    for receiver in end_systems:
+                        expected = [] if sender == receiver else self.__search_path(topology, sender, receiver)
+                        path = paths[sender][receiver]
+                        self.assertEqual(list(path), expected, description)
+                        self.assertEqual(len(path), len(expected))
+                        if len(expected) > 0:
+                            self.assertEqual(path[-1], expected[-1])
+                            self.assertEqual(path[0], expected[0])
+
+    def test_large_network(self):
+        """
+        Checks that the paths of a network with 5000 end systems are found in the time budget
+        """
+        network = Network()
+        network.create_network(LARGE_NETWORK)
+        network.generate_paths()
+        senders = Random(1).sample(get_end_systems(network.get_topology()), NUMBER_SENDERS)
+        start = time.perf_counter()
+        number_paths = expand_paths(network, senders)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(number_paths, NUMBER_SENDERS * 4999)
+        self.assertLess(elapsed, BUDGET)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--benchmark':
+        benchmark()
+    else:
+        unittest.main()
@@ -0,0 +1,103 @@
+"""* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * *
+ *                                                                                                                     *
+ *  Slots Memory Test                                                                                                  *
+ *  Network Generator                                                                                                  *
+ *                                                                                                                     *
+ *  Created by Francisco Pozo on 30/08/16.                                                                             *
+ *  Copyright © 2016 Francisco Pozo. All rights reserved.                                                              *
+ *                                                                                                                     *
+ *  Test that the frames, links, nodes and dependencies keep their attributes in slots. A network has millions of them *
+ *  in large sweeps, so every object is measured with tracemalloc against the same class with a dictionary for the    *
+ *  attributes (the class before the slots). Run it as a script to print the bytes per object of both versions.       *
+ *                                                                                                                     *
+ * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * """
+
+import os
+import sys
+import tracemalloc
+import unittest
+from types import MemberDescriptorType
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from DENetwork.Dependency import *
+from DENetwork.Frame import *
+from DENetwork.Link import *
+from DENetwork.Node import *
+
+NUMBER_OBJECTS = 10000  # Number of objects created to measure the bytes per object
+CLASSES = [(Frame, (1, [2])),  # Class and arguments to create an object of every measured class
+           (Link, ()),
+           (Node, (NodeType.switch,)),
+           (Dependency, (0, 0, 1, 1, 100, 200))]
+
+
+def get_dict_class(slots_class):
+    """
+    Gets the same class without slots, so its objects keep the attributes in a dictionary
+    :param slots_class: class with slots
+    :return: class with the same functions and a dictionary for the attributes
+    """
+    namespace = {name: value for name, value in vars(slots_class).items() if name != '__slots__' and
+                 not isinstance(value, MemberDescriptorType)}  # Without the slots and their attribute descriptors
+    return type(slots_class.__name__, slots_class.__bases__, namespace)
+
+
+def measure(object_class, arguments):
+    """
+    Measures the memory of the objects of a class with tracemalloc
+    :param object_class: class of the objects
+    :param arguments: tuple with the arguments to create an object
+    :return: bytes per object
+    """
+    objects = [None] * NUMBER_OBJECTS  # Allocated before measuring, so only the objects are counted
+    tracemalloc.start()
+    for index in range(NUMBER_OBJECTS):
+        objects[index] = object_class(*arguments)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / NUMBER_OBJECTS
+
+
+def measure_class(slots_class, arguments):
+    """
+    Measures the bytes per object of a class with slots and of the same class with a dictionary
+    :param slots_class: class with slots
+    :param arguments: tuple with the arguments to create an object
+    :return: tuple with the bytes per object with the dictionary and with the slots
+    """
+    return measure(get_dict_class(slots_class), arguments), measure(slots_class, arguments)
+
+
+class SlotsMemoryTest(unittest.TestCase):
+    """
+    Class with the tests of the memory of the objects with slots
+    """
+
+    # Public function definitions #
+
+    def test_no_dictionary(self):
+        """
+        Checks that the objects have no dictionary for the attributes
+        """
+        for slots_class, arguments in CLASSES:
+            self.assertFalse(hasattr(slots_class(*arguments), '__dict__'),
+                             slots_class.__name__ + " objects have a dictionary")
+
+    def test_smaller_objects(self):
+        """
+        Checks that the objects with slots take less memory than with a dictionary
+        """
+        for slots_class, arguments in CLASSES:
+            dict_size, slots_size = measure_class(slots_class, arguments)
+            self.assertLess(slots_size, dict_size, slots_class.__name__ + " objects are not smaller with slots")
+
+
+if __name__ == '__main__':
+    if '--table' in sys.argv:
+        print("{:<12}{:>12}{:>12}".format('Class', 'Dictionary', 'Slots'))
+        for measured_class, measured_arguments in CLASSES:
+            dict_bytes, slots_bytes = measure_class(measured_class, measured_arguments)
+            print("{:<12}{:>12.0f}{:>12.0f}".format(measured_class.__name__, dict_bytes, slots_bytes))
+    else:
+        unittest.main()